@@ -0,0 +1,96 @@
+'''
+Batch simulator stepping many independent vacuum worlds at once.
+World state lives in NumPy arrays (one row per world) and the agent
+policy is applied to the whole batch on every tick.
+'''
+import time
+
+import numpy as np
+
+from vacuum_encoding import (ACTIONS, DIRTY, DOWN, LEFT, RIGHT, SUCK,
+                             TWO_SQUARE_MOVES, compile_moves)
+
+
+class BatchEnvironment:
+    def __init__(self, locations, moves, batch_size, start=None, dirt=None, seed=None):
+        self.LOCATIONS = list(locations)
+        self.MOVES = np.asarray(compile_moves(self.LOCATIONS, moves)).reshape(len(self.LOCATIONS), len(ACTIONS))
+        # Move actions leaving each location, valid ones first so one random index picks a valid move
+        valid = self.MOVES[:, RIGHT:DOWN + 1] != np.arange(len(self.LOCATIONS))[:, None]
+        self.MOVE_OPTIONS = np.argsort(~valid, axis=1, kind='stable') + RIGHT
+        self.MOVE_COUNTS = np.maximum(valid.sum(axis=1), 1)
+        self.rng = np.random.default_rng(seed)
+        self.rows = np.arange(batch_size)
+        if start is None:  # Random starting square for every world
+            self.location = self.rng.integers(0, len(self.LOCATIONS), batch_size)
+        else:
+            self.location = np.full(batch_size, self.LOCATIONS.index(start))
+        if dirt is None:  # All squares Dirty
+            self.dirt = np.ones((batch_size, len(self.LOCATIONS)), dtype=bool)
+        else:
+            self.dirt = np.array(dirt, dtype=bool).reshape(batch_size, len(self.LOCATIONS))
+        self.dirty_count = self.dirt.sum(axis=1)
+
+    def Sensors(self):  # Sense all environments -> (location, status) arrays
+        return self.location, self.dirt[self.rows, self.location].astype(np.int8)
+
+    def Actuators(self, actions):  # Modify all environments
+        suck = (actions == SUCK) & self.dirt[self.rows, self.location]
+        self.dirt[self.rows[suck], self.location[suck]] = False
+        self.dirty_count -= suck
+        self.location = self.MOVES[self.location, actions]
+
+    def all_clean(self):  # Boolean mask of worlds with no dirt left
+        return self.dirty_count == 0
+
+
+'''
+Policies map (location, status, environment) arrays to an array of actions.
+'''
+def REFLEX_VACUUM_POLICY(location, status, environment):  # reflex_vacuum_agent.py
+    return np.where(status == DIRTY, SUCK, np.where(location == 0, RIGHT, LEFT))
+
+
+def RANDOM_VACUUM_POLICY(location, status, environment):  # reflex_vacuum_agent_homework.py
+    choice = (environment.rng.random(len(location)) * environment.MOVE_COUNTS[location]).astype(np.intp)
+    return np.where(status == DIRTY, SUCK, environment.MOVE_OPTIONS[location, choice])
+
+
+def run_batch(environment, policy, n):
+    '''
+    Step every world for at most n ticks.
+    Return the number of steps each world needed to become clean (-1 if it did not).
+    '''
+    steps_to_clean = np.full(len(environment.rows), -1)
+    steps_to_clean[environment.all_clean()] = 0
+    for step in range(1, n + 1):
+        (location, status) = environment.Sensors()
+        environment.Actuators(policy(location, status, environment))
+        newly_clean = (steps_to_clean < 0) & environment.all_clean()
+        steps_to_clean[newly_clean] = step
+        if (steps_to_clean >= 0).all():
+            break
+    return steps_to_clean
+
+
+def summarize(name, steps_to_clean, elapsed):
+    done = steps_to_clean[steps_to_clean >= 0]
+    print("{:32s}{:>10d}{:>10.2f}{:>8d}{:>10.3f}s".format(
+        name, len(steps_to_clean), done.mean() if len(done) else float('nan'),
+        done.max() if len(done) else -1, elapsed))
+
+
+def run(batch_size=100000, n=1000, seed=0):  # Monte Carlo run of both agents
+    from reflex_vacuum_agent_homework import MOVES
+    print('{:32s}{:>10s}{:>10s}{:>8s}{:>11s}'.format('agent', 'worlds', 'mean', 'max', 'time'))
+    for name, locations, moves, start, policy in [
+            ('reflex_vacuum_agent', ['A', 'B'], TWO_SQUARE_MOVES, 'A', REFLEX_VACUUM_POLICY),
+            ('reflex_vacuum_agent_homework', ['A', 'B', 'C', 'D'], MOVES, None, RANDOM_VACUUM_POLICY)]:
+        environment = BatchEnvironment(locations, moves, batch_size, start=start, seed=seed)
+        start_time = time.perf_counter()
+        steps_to_clean = run_batch(environment, policy, n)
+        summarize(name, steps_to_clean, time.perf_counter() - start_time)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,130 @@
+'''
+Benchmark of the L1 agent designs over seeded random worlds.
+For every agent and world size it reports the steps-to-clean distribution,
+per-step latency and peak memory, and writes the results as JSON.
+
+Agents with a hard-coded world (simple reflex, table-driven) are run on that
+world only; the others are run on grids of growing size.
+'''
+import json
+import random
+import statistics
+import time
+import tracemalloc
+
+from grid_vacuum import GridMoves
+from simple_reflex_agent import SIMPLE_REFLEX_AGENT
+from table_driven_agent import FULL_TRIE, TrieTableDrivenAgent
+from vacuum_agents import FrontierReflexAgentWithState, ReflexAgentWithState, VacuumEnvironment
+from vacuum_encoding import STATUSES, TWO_SQUARE_MOVES
+
+# Moves made by simple_reflex_agent.Actuators
+SIMPLE_REFLEX_MOVES = {
+    'A': {'Right': 'B'},
+    'B': {'Down': 'D'},
+    'C': {'Up': 'A'},
+    'D': {'Left': 'C'}
+}
+
+
+class RandomWalkAgent:  # reflex_vacuum_agent_homework.REFLEX_VACUUM_AGENT on any MOVES map
+    def __init__(self, moves, seed=None):
+        self.MOVES = moves
+        self.rng = random.Random(seed)
+
+    def __call__(self, percept):
+        (location, status) = percept
+        if status == 'Dirty':
+            return 'Suck'
+        return self.rng.choice(list(self.MOVES[location]))
+
+
+def grid_worlds(sizes):
+    return [('{0}x{0}'.format(size), GridMoves(size, size)) for size in sizes]
+
+
+def benchmark_agents(sizes):  # (agent name, factory(moves, seed), [(world name, moves)])
+    return [
+        ('simple_reflex', lambda moves, seed: SIMPLE_REFLEX_AGENT, [('2x2', SIMPLE_REFLEX_MOVES)]),
+        ('table_driven', lambda moves, seed: TrieTableDrivenAgent(FULL_TRIE), [('1x2', TWO_SQUARE_MOVES)]),
+        ('reflex_with_state', ReflexAgentWithState, grid_worlds(sizes)),
+        ('frontier_with_state', FrontierReflexAgentWithState, grid_worlds(sizes)),
+        ('random_walk', RandomWalkAgent, grid_worlds(sizes)),
+    ]
+
+
+def run_episode(make_agent, moves, seed, n):
+    '''
+    Run one agent in a seeded random world until it is clean, the agent stops
+    acting, or n steps pass. Return (steps to clean or -1, steps taken).
+    '''
+    rng = random.Random(seed)
+    dirt = {location: rng.choice(STATUSES) for location in moves}
+    environment = VacuumEnvironment(moves, start=rng.choice(list(moves)), dirt=dirt)
+    agent = make_agent(moves, seed)
+    steps = 0
+    while not environment.all_clean():
+        if steps == n:
+            return -1, steps
+        action = agent(environment.Sensors())
+        if action in (None, 'NoOp'):  # Agent gave up on a dirty world
+            return -1, steps
+        environment.Actuators(action)
+        steps += 1
+    return steps, steps
+
+
+def peak_memory(make_agent, moves, seed, n):  # Peak bytes allocated while running one episode
+    tracemalloc.start()
+    run_episode(make_agent, moves, seed, n)
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def benchmark(sizes=(2, 4, 8, 16, 32), episodes=20, seed=0):
+    results = []
+    for agent_name, make_agent, worlds in benchmark_agents(sizes):
+        for world_name, moves in worlds:
+            n = 200 * len(moves)
+            steps_to_clean = []
+            total_steps = 0
+            start_time = time.perf_counter()
+            for episode in range(episodes):
+                (steps, taken) = run_episode(make_agent, moves, seed + episode, n)
+                steps_to_clean.append(steps)
+                total_steps += taken
+            elapsed = time.perf_counter() - start_time
+            solved = sorted(steps for steps in steps_to_clean if steps >= 0)
+            results.append({
+                'agent': agent_name,
+                'world': world_name,
+                'squares': len(moves),
+                'episodes': episodes,
+                'solved': len(solved),
+                'steps_mean': statistics.fmean(solved) if solved else None,
+                'steps_median': statistics.median(solved) if solved else None,
+                'steps_p90': solved[int(0.9 * (len(solved) - 1))] if solved else None,
+                'steps_max': solved[-1] if solved else None,
+                'ns_per_step': 1e9 * elapsed / total_steps if total_steps else None,
+                'peak_memory_bytes': peak_memory(make_agent, moves, seed, n),
+            })
+    return results
+
+
+def run(path='benchmark_results.json'):
+    results = benchmark()
+    print('{:22s}{:>8s}{:>8s}{:>10s}{:>8s}{:>10s}{:>12s}'.format(
+        'agent', 'world', 'solved', 'mean', 'max', 'ns/step', 'peak bytes'))
+    for result in results:
+        print('{agent:22s}{world:>8s}{solved:>8d}{mean:>10s}{max:>8s}{ns:>10.0f}{peak_memory_bytes:>12d}'.format(
+            mean='-' if result['steps_mean'] is None else '{:.1f}'.format(result['steps_mean']),
+            max='-' if result['steps_max'] is None else str(result['steps_max']),
+            ns=result['ns_per_step'] or 0, **result))
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+    print('Results written to', path)
+
+
+if __name__ == '__main__':
+    run()
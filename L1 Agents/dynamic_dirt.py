@@ -0,0 +1,79 @@
+'''
+Vacuum world where dirt reappears stochastically, with an event-driven
+scheduler. While the agent has nothing to do (NoOp in a clean world) the
+scheduler jumps straight to the next dirt event instead of ticking NoOps.
+'''
+import math
+import random
+import time
+
+from grid_vacuum import GridMoves
+from vacuum_agents import FrontierReflexAgentWithState, VacuumEnvironment
+
+
+class DynamicDirtEnvironment(VacuumEnvironment):
+    '''
+    Every square gets dirty at dirt_rate per tick (a Poisson process), so dirt
+    events over the whole world arrive at dirt_rate * squares per tick.
+    dirt_rate=0 gives a static world with no events.
+    '''
+    def __init__(self, moves, dirt_rate, start=None, dirt=None, seed=None):
+        super().__init__(moves, start, dirt, seed)
+        self.LOCATIONS = list(moves)
+        self.rate = dirt_rate * len(self.LOCATIONS)
+        self.rng = random.Random(seed)
+        self.next_event = self.rng.expovariate(self.rate) if self.rate > 0 else float('inf')
+        self.dirt_events = 0
+
+    def advance(self, t):  # Apply every dirt event up to time t
+        while self.next_event <= t:
+            square = self.rng.choice(self.LOCATIONS)
+            if self.status[square] == 'Clean':
+                self.status[square] = 'Dirty'
+                self.dirty_count += 1
+            self.dirt_events += 1
+            self.next_event += self.rng.expovariate(self.rate)
+
+
+def RUN_DYNAMIC(environment, agent, horizon, event_driven=True):
+    '''
+    Run agent for horizon ticks. The agent forgets its model whenever dirt
+    may have come back, so it explores again. Return counters for the run.
+    '''
+    stats = {'ticks': horizon, 'agent_calls': 0, 'skipped_ticks': 0, 'sucks': 0}
+    t = 0
+    while t < horizon:
+        environment.advance(t)
+        action = agent(environment.Sensors())
+        stats['agent_calls'] += 1
+        if action == 'NoOp':
+            if not environment.all_clean():
+                agent.forget()  # Dirt came back behind the agent's model
+            elif event_driven:  # Nothing to do until the next dirt event
+                # The skipped ticks would all be NoOps that leave the agent unchanged, so the
+                # agent next sees the world at the tick the dirt appears, as in the ticked run
+                wake = max(t + 1, math.ceil(min(horizon, environment.next_event)))
+                stats['skipped_ticks'] += wake - t - 1
+                t = wake
+                continue
+        else:
+            stats['sucks'] += action == 'Suck'
+            environment.Actuators(action)
+        t += 1
+    stats['dirt_events'] = environment.dirt_events
+    return stats
+
+
+def run(size=10, dirt_rate=1e-5, horizon=2000000, seed=0):
+    moves = GridMoves(size, size)
+    for event_driven in [False, True]:
+        environment = DynamicDirtEnvironment(moves, dirt_rate, seed=seed)
+        agent = FrontierReflexAgentWithState(moves, seed=seed)
+        start_time = time.perf_counter()
+        stats = RUN_DYNAMIC(environment, agent, horizon, event_driven)
+        print('{:13s}{:.2f}s {}'.format(
+            'event-driven' if event_driven else 'ticked', time.perf_counter() - start_time, stats))
+
+
+if __name__ == '__main__':
+    run()
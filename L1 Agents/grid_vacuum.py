@@ -0,0 +1,100 @@
+'''
+N x M grid vacuum world generalizing the hard-coded 2 x 2 MOVES maps.
+Squares are numbered row by row, adjacency is computed on demand and dirt
+is held in a bytearray with a running count of dirty squares.
+'''
+import random
+import time
+from array import array
+from collections.abc import Mapping
+
+from vacuum_encoding import ACTIONS, DOWN, LEFT, RIGHT, UP
+
+
+class GridMoves(Mapping):  # Behaves like a MOVES dict: square -> {direction: neighbour}
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+
+    def __getitem__(self, square):
+        if not 0 <= square < self.rows * self.cols:
+            raise KeyError(square)
+        (row, col) = divmod(square, self.cols)
+        moves = {}
+        if col < self.cols - 1:
+            moves['Right'] = square + 1
+        if col > 0:
+            moves['Left'] = square - 1
+        if row > 0:
+            moves['Up'] = square - self.cols
+        if row < self.rows - 1:
+            moves['Down'] = square + self.cols
+        return moves
+
+    def __iter__(self):
+        return iter(range(self.rows * self.cols))
+
+    def __len__(self):
+        return self.rows * self.cols
+
+    def table(self):  # Flat move table in the compile_moves layout, built a direction at a time
+        squares = range(self.rows * self.cols)
+        table = array('i', [square for square in squares for _ in ACTIONS])
+        last_col = self.cols - 1
+        last_row_start = (self.rows - 1) * self.cols
+        table[RIGHT::len(ACTIONS)] = array('i', [s + 1 if s % self.cols < last_col else s for s in squares])
+        table[LEFT::len(ACTIONS)] = array('i', [s - 1 if s % self.cols else s for s in squares])
+        table[UP::len(ACTIONS)] = array('i', [s - self.cols if s >= self.cols else s for s in squares])
+        table[DOWN::len(ACTIONS)] = array('i', [s + self.cols if s < last_row_start else s for s in squares])
+        return table
+
+
+class GridEnvironment:
+    def __init__(self, rows, cols, dirt_probability=1.0, start=None, seed=None):
+        rng = random.Random(seed)
+        self.MOVES = GridMoves(rows, cols)
+        squares = rows * cols
+        if dirt_probability >= 1:
+            self.dirt = bytearray(b'\x01' * squares)
+        else:
+            self.dirt = bytearray(rng.random() < dirt_probability for _ in range(squares))
+        self.dirty_count = self.dirt.count(1)
+        self.current = rng.randrange(squares) if start is None else start
+
+    def Sensors(self):  # Sense Environment
+        return (self.current, 'Dirty' if self.dirt[self.current] else 'Clean')
+
+    def Actuators(self, action):  # Modify Environment
+        if action == 'Suck':
+            if self.dirt[self.current]:
+                self.dirt[self.current] = 0
+                self.dirty_count -= 1
+        else:
+            self.current = self.MOVES[self.current].get(action, self.current)
+
+    def all_clean(self):  # O(1) using the running dirty count
+        return self.dirty_count == 0
+
+
+def run(rows=1000, cols=1000, batch_size=64, n=1000):
+    from batch_vacuum import RANDOM_VACUUM_POLICY, BatchEnvironment, run_batch
+
+    environment = GridEnvironment(rows, cols, dirt_probability=0.5, seed=0)
+    start_time = time.perf_counter()
+    for _ in range(n * 10):
+        (location, status) = environment.Sensors()
+        environment.Actuators('Suck' if status == 'Dirty' else random.choice(list(environment.MOVES[location])))
+    elapsed = time.perf_counter() - start_time
+    print('single {}x{} world: {:,.0f} steps/s'.format(rows, cols, n * 10 / elapsed))
+
+    start_time = time.perf_counter()
+    environment = BatchEnvironment(range(rows * cols), GridMoves(rows, cols), batch_size, seed=0)
+    print('batch setup: {:.2f}s'.format(time.perf_counter() - start_time))
+    start_time = time.perf_counter()
+    run_batch(environment, RANDOM_VACUUM_POLICY, n)
+    elapsed = time.perf_counter() - start_time
+    print('{} batched {}x{} worlds: {:,.0f} steps/s'.format(batch_size, rows, cols, batch_size * n / elapsed))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,81 @@
+'''
+Headless run mode for the L1 agents. Instead of printing a table row per step,
+every step is recorded into preallocated array columns that can be exported
+to CSV or NPZ in bulk and summarized afterwards.
+'''
+from array import array
+
+from vacuum_encoding import ACTIONS, STATUSES, SUCK
+
+
+class Trace:
+    FIELDS = ('location', 'status', 'action', 'new_location', 'new_status')
+
+    def __init__(self, n, locations):
+        self.LOCATIONS = list(locations)
+        self.columns = {field: array('b', bytes(n)) for field in self.FIELDS}  # Preallocated, one byte per step
+        self.length = 0
+        self.steps_to_clean = None  # Step after which the environment was clean, if observed
+
+    def __len__(self):
+        return self.length
+
+    def rows(self):  # Decoded (location, status, action, new location, new status) rows
+        decode = (self.LOCATIONS, STATUSES, ACTIONS, self.LOCATIONS, STATUSES)
+        columns = [self.columns[field] for field in self.FIELDS]
+        for i in range(self.length):
+            yield tuple(names[column[i]] for names, column in zip(decode, columns))
+
+    def to_csv(self, path):
+        import csv
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(self.FIELDS)
+            writer.writerows(self.rows())
+
+    def to_npz(self, path):
+        import numpy as np
+        np.savez_compressed(path, locations=self.LOCATIONS, statuses=STATUSES, actions=ACTIONS,
+                            **{field: np.frombuffer(self.columns[field], dtype=np.int8)[:self.length]
+                               for field in self.FIELDS})
+
+    def summary(self):
+        return {
+            'steps': self.length,
+            'steps_to_clean': self.steps_to_clean,
+            'suck_count': self.columns['action'][:self.length].count(SUCK)
+        }
+
+
+def environment_clean(environment, locations):  # Clean test for the module-level Environment dicts
+    return lambda: all(environment[location] == 'Clean' for location in locations)
+
+
+def run_headless(agent, sensors, actuators, n, locations, all_clean=None, stop_on_noop=False):
+    '''
+    Run agent through n steps without printing. Return the Trace of the run.
+    '''
+    trace = Trace(n, locations)
+    location_code = {location: i for i, location in enumerate(locations)}
+    status_code = {status: i for i, status in enumerate(STATUSES)}
+    action_code = {action: i for i, action in enumerate(ACTIONS)}
+    (location_column, status_column, action_column, new_location_column, new_status_column) = (
+        trace.columns[field] for field in Trace.FIELDS)
+    if all_clean is not None and all_clean():
+        trace.steps_to_clean = 0
+    for i in range(n):
+        (location, status) = sensors()
+        action = agent((location, status))
+        actuators(action)
+        (new_location, new_status) = sensors()
+        location_column[i] = location_code[location]
+        status_column[i] = status_code[status]
+        action_column[i] = action_code[action]
+        new_location_column[i] = location_code[new_location]
+        new_status_column[i] = status_code[new_status]
+        trace.length = i + 1
+        if trace.steps_to_clean is None and all_clean is not None and all_clean():
+            trace.steps_to_clean = i + 1
+        if stop_on_noop and action == 'NoOp':
+            break
+    return trace
@@ -0,0 +1,70 @@
+'''
+Parallel Monte Carlo evaluation of the randomized homework vacuum agent.
+Seeded episodes are sharded over a process pool, each shard with its own
+independent RNG stream, and the per-shard time-to-clean histograms are merged.
+'''
+import math
+import os
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from batch_vacuum import RANDOM_VACUUM_POLICY, BatchEnvironment, run_batch
+from reflex_vacuum_agent_homework import MOVES
+
+
+def run_shard(episodes, seed_sequence, n):  # Histogram of steps-to-clean and count of unfinished episodes
+    environment = BatchEnvironment(list(MOVES), MOVES, episodes, seed=seed_sequence)
+    steps_to_clean = run_batch(environment, RANDOM_VACUUM_POLICY, n)
+    return np.bincount(steps_to_clean[steps_to_clean >= 0], minlength=n + 1), int((steps_to_clean < 0).sum())
+
+
+def summarize_histogram(histogram, failures, z=1.96):
+    steps = np.arange(len(histogram))
+    count = int(histogram.sum())
+    if count == 0:  # No episode finished within n steps
+        return {'episodes': failures, 'unfinished': failures, 'mean': None, 'mean_ci': None, 'std': None,
+                'median': None, 'p90': None, 'p99': None, 'max': None}
+    mean = float((steps * histogram).sum() / count)
+    variance = float(((steps - mean) ** 2 * histogram).sum() / max(count - 1, 1))
+    half_width = z * math.sqrt(variance / count)
+    cumulative = np.cumsum(histogram)
+    percentile = lambda q: int(np.searchsorted(cumulative, q * count))
+    return {
+        'episodes': count + failures,
+        'unfinished': failures,
+        'mean': mean,
+        'mean_ci': (mean - half_width, mean + half_width),
+        'std': math.sqrt(variance),
+        'median': percentile(0.5),
+        'p90': percentile(0.9),
+        'p99': percentile(0.99),
+        'max': int(steps[histogram > 0].max()),
+    }
+
+
+def MONTE_CARLO(episodes, n=1000, processes=None, seed=0, shard_size=50000):
+    '''
+    Run episodes of the homework agent for at most n steps each.
+    Return the merged steps-to-clean histogram and its summary.
+    '''
+    shards = [shard_size] * (episodes // shard_size) + ([episodes % shard_size] if episodes % shard_size else [])
+    streams = np.random.SeedSequence(seed).spawn(len(shards))
+    with Pool(processes or os.cpu_count()) as pool:
+        results = pool.starmap(run_shard, [(size, stream, n) for size, stream in zip(shards, streams)])
+    histogram = sum((shard_histogram for shard_histogram, _ in results), np.zeros(n + 1, dtype=np.int64))
+    failures = sum(shard_failures for _, shard_failures in results)
+    return histogram, summarize_histogram(histogram, failures)
+
+
+def run(episodes=1000000):
+    start_time = time.perf_counter()
+    (_, summary) = MONTE_CARLO(episodes)
+    print('{:,} episodes in {:.2f}s'.format(episodes, time.perf_counter() - start_time))
+    for key, value in summary.items():
+        print('{:12s}{}'.format(key, value))
+
+
+if __name__ == '__main__':
+    run()
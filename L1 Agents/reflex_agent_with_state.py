@@ -1,3 +1,5 @@
+from headless import environment_clean, run_headless
+
 A = 'A'
 B = 'B'
 state = {}
@@ -69,7 +71,10 @@ def Actuators(action):  # Modify Environment
         Environment['Current'] = A
 
 
-def run(n):  # run the agent through n steps
+def run(n, headless=False):  # run the agent through n steps
+    if headless:  # Record the run into a Trace instead of printing it
+        return run_headless(REFLEX_AGENT_WITH_STATE, Sensors, Actuators, n - 1, [A, B],
+                            environment_clean(Environment, [A, B]))
     print('    Current                        New')
     print('location    status  action  location    status')
     for i in range(1, n):
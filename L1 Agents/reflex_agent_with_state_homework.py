@@ -1,5 +1,7 @@
 import random
 
+from headless import environment_clean, run_headless
+
 A, B, C, D = 'A', 'B', 'C', 'D'
 
 state = {}
@@ -63,7 +65,10 @@ def Actuators(action):
     elif action in MOVES[location]:
         Environment['Current'] = MOVES[location][action]
 
-def run(n):
+def run(n, headless=False):
+    if headless:  # Record the run into a Trace instead of printing it
+        return run_headless(REFLEX_AGENT_WITH_STATE, Sensors, Actuators, n, list(MOVES),
+                            environment_clean(Environment, list(MOVES)), stop_on_noop=True)
     print('    Current                        New')
     print('location    status  action  location    status')
     for i in range(1, n + 1):
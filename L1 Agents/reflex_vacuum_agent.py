@@ -1,3 +1,5 @@
+from headless import environment_clean, run_headless
+
 A = 'A'
 B = 'B'
 
@@ -32,7 +34,10 @@ def Actuators(action):  # Modify Environment
         Environment['Current'] = A
 
 
-def run(n):  # run the agent through n steps
+def run(n, headless=False):  # run the agent through n steps
+    if headless:  # Record the run into a Trace instead of printing it
+        return run_headless(REFLEX_VACUUM_AGENT, Sensors, Actuators, n - 1, [A, B],
+                            environment_clean(Environment, [A, B]))
     print('    Current                        New')
     print('location    status  action  location    status')
     for i in range(1, n):
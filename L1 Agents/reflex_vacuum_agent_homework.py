@@ -1,5 +1,7 @@
 import random
 
+from headless import environment_clean, run_headless
+
 # Define environment with all locations Dirty
 Environment = {
     'A': 'Dirty',
@@ -45,7 +47,10 @@ def Actuators(action):
 
 
 # Run simulation
-def run(n):
+def run(n, headless=False):
+    if headless:  # Record the run into a Trace instead of printing it
+        return run_headless(REFLEX_VACUUM_AGENT, Sensors, Actuators, n, list(MOVES),
+                            environment_clean(Environment, list(MOVES)))
     print('    Current                        New')
     print('location    status  action  location    status')
     for i in range(1, n + 1):
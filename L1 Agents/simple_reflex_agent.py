@@ -1,3 +1,6 @@
+from headless import environment_clean, run_headless
+from vacuum_encoding import STATUSES
+
 A = 'A'
 B = 'B'
 C = 'C'
@@ -49,6 +52,31 @@ def SIMPLE_REFLEX_AGENT(percept):  # Determine action
     return action
 
 
+'''
+Compile rules/RULE_ACTION into a flat list indexed by an encoded percept,
+location index * len(STATUSES) + status index.
+'''
+def COMPILE_RULES(rules, rule_action, locations):
+    policy = [None] * (len(locations) * len(STATUSES))
+    for condition, rule in rules.items():
+        if len(condition) == 2 and condition[0] in locations:  # Only (location, status) rules match a percept
+            policy[ENCODE_PERCEPT(condition, locations)] = rule_action[rule]
+    return policy
+
+
+def ENCODE_PERCEPT(percept, locations):  # (location, status) -> int
+    (location, status) = percept
+    return locations.index(location) * len(STATUSES) + STATUSES.index(status)
+
+
+LOCATIONS = [A, B, C, D]
+POLICY = COMPILE_RULES(rules, RULE_ACTION, LOCATIONS)
+
+
+def COMPILED_SIMPLE_REFLEX_AGENT(percept_code):  # Determine action for an encoded percept
+    return POLICY[percept_code]
+
+
 def Sensors():  # Sense Environment
     location = Environment['Current']
     return (location, Environment[location])
@@ -68,7 +96,10 @@ def Actuators(action):  # Modify Environment
         Environment['Current'] = D
 
 
-def run(n):  # run the agent through n steps
+def run(n, headless=False):  # run the agent through n steps
+    if headless:  # Record the run into a Trace instead of printing it
+        return run_headless(SIMPLE_REFLEX_AGENT, Sensors, Actuators, n - 1, [A, B, C, D],
+                            environment_clean(Environment, [A, B, C, D]))
     print('    Current                        New')
     print('location    status  action  location    status')
     for i in range(1, n):
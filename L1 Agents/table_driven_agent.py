@@ -1,3 +1,5 @@
+import itertools
+
 A = 'A'
 B = 'B'
 percepts = []
@@ -29,6 +31,59 @@ def TABLE_DRIVEN_AGENT(percept):  # Determine action based on table and percepts
     return action
 
 
+'''
+Prefix trie over the table's percept sequences. Node 0 is the empty history,
+EDGES[node] maps a percept to the child node and ACTIONS[node] holds the action.
+'''
+def BUILD_TRIE(table):
+    edges = [{}]
+    actions = [None]
+    for percept_sequence, action in table.items():
+        node = 0
+        for percept in percept_sequence:
+            child = edges[node].get(percept)
+            if child is None:
+                child = len(edges)
+                edges[node][percept] = child
+                edges.append({})
+                actions.append(None)
+            node = child
+        actions[node] = action
+    return edges, actions
+
+
+class TrieTableDrivenAgent:  # Cursor into a trie that may be shared by many agents
+    def __init__(self, trie):
+        (self.EDGES, self.ACTIONS) = trie
+        self.node = 0
+
+    def __call__(self, percept):  # Move the cursor one edge, O(1) per step
+        if self.node is not None:
+            self.node = self.EDGES[self.node].get(percept)
+        return None if self.node is None else self.ACTIONS[self.node]
+
+
+TRIE = BUILD_TRIE(table)
+
+
+'''
+The table written out in full for the two-square world: every percept
+sequence of up to length percepts, with the reflex vacuum agent's action
+for the last percept. A clean-up takes at most three steps.
+'''
+def FULL_TABLE(length=4):
+    all_percepts = [(location, status) for location in (A, B) for status in ('Clean', 'Dirty')]
+    full_table = {}
+    for size in range(1, length + 1):
+        for percept_sequence in itertools.product(all_percepts, repeat=size):
+            (location, status) = percept_sequence[-1]
+            full_table[percept_sequence] = 'Suck' if status == 'Dirty' else 'Right' if location == A else 'Left'
+    return full_table
+
+
+FULL_TRIE = BUILD_TRIE(FULL_TABLE())
+
+
 def run():  # run agent on several sequential percepts
     print('Action\tPercepts')
     print(TABLE_DRIVEN_AGENT((A, 'Clean')), '\t', percepts)
@@ -37,5 +92,13 @@ def run():  # run agent on several sequential percepts
     print(TABLE_DRIVEN_AGENT((B, 'Dirty')), '\t', percepts)
     print(TABLE_DRIVEN_AGENT((B, 'Clean')), '\t', percepts)
 
+
+def run_trie():  # Same percepts through the trie-backed agent
+    agent = TrieTableDrivenAgent(TRIE)
+    print('Action\tPercept')
+    for percept in [(A, 'Clean'), (A, 'Dirty'), (B, 'Clean'), (B, 'Dirty'), (B, 'Clean')]:
+        print(agent(percept), '\t', percept)
+
+
 if __name__ == '__main__':
     run()
@@ -0,0 +1,187 @@
+'''
+Reflex agent with state and its environment as classes, so every agent keeps
+its own state, action and model and many agents can run side by side.
+'''
+import random
+from collections import deque
+from multiprocessing import Pool
+
+from reflex_agent_with_state_homework import MOVES
+
+
+class ReflexAgentWithState:
+    def __init__(self, moves=MOVES, seed=None):
+        self.MOVES = moves
+        self.state = None
+        self.action = None
+        self.model = {location: None for location in moves}  # Initially ignorant
+        self.clean_count = 0  # Squares the model knows to be Clean
+        self.rng = random.Random(seed)
+
+    def INTERPRET_INPUT(self, percept):
+        return percept
+
+    def UPDATE_STATE(self, state, action, percept):
+        (location, status) = self.INTERPRET_INPUT(percept)
+        previous = self.model[location]
+        if previous != status:
+            self.clean_count += (status == 'Clean') - (previous == 'Clean')
+            self.model[location] = status
+        return percept
+
+    def RULE_MATCH(self, state):
+        (location, status) = state
+        if self.clean_count == len(self.model):
+            return 'NoOp'
+        if status == 'Dirty':
+            return 'Suck'
+
+        # Pick a direction toward an unknown or dirty neighbour
+        for direction, neighbour in self.MOVES[location].items():
+            if self.model[neighbour] != 'Clean':
+                return direction
+
+        # No known dirty neighbours; pick any valid move randomly
+        return self.rng.choice(list(self.MOVES[location]))
+
+    def __call__(self, percept):  # REFLEX_AGENT_WITH_STATE
+        self.state = self.UPDATE_STATE(self.state, self.action, percept)
+        self.action = self.RULE_MATCH(self.state)
+        return self.action
+
+    def forget(self):  # Back to ignorant, e.g. when dirt may have come back
+        self.model = dict.fromkeys(self.model)
+        self.clean_count = 0
+
+
+class FrontierReflexAgentWithState(ReflexAgentWithState):
+    '''
+    Heads for the nearest square not known to be Clean along a BFS path
+    instead of moving randomly when no neighbour is dirty or unknown.
+    '''
+    def __init__(self, moves=MOVES, seed=None):
+        super().__init__(moves, seed)
+        self.plan = []  # Directions to the current target, next move last
+
+    def RULE_MATCH(self, state):
+        (location, status) = state
+        if self.clean_count == len(self.model):
+            return 'NoOp'
+        if status == 'Dirty':
+            return 'Suck'
+        if not self.plan:
+            self.plan = self.PLAN_TO_FRONTIER(location)
+        return self.plan.pop() if self.plan else 'NoOp'  # NoOp if the rest is unreachable
+
+    def forget(self):
+        super().forget()
+        self.plan = []
+
+    def PLAN_TO_FRONTIER(self, location):  # BFS to the nearest unknown or dirty square
+        parents = {location: None}
+        queue = deque([location])
+        while queue:
+            square = queue.popleft()
+            for direction, neighbour in self.MOVES[square].items():
+                if neighbour in parents:
+                    continue
+                parents[neighbour] = (square, direction)
+                if self.model[neighbour] != 'Clean':
+                    plan = []
+                    while neighbour != location:
+                        (neighbour, direction) = parents[neighbour]
+                        plan.append(direction)
+                    return plan
+                queue.append(neighbour)
+        return []
+
+
+class VacuumEnvironment:
+    def __init__(self, moves=MOVES, start=None, dirt=None, seed=None):
+        self.MOVES = moves
+        self.status = dict.fromkeys(moves, 'Dirty') if dirt is None else dict(dirt)
+        self.dirty_count = sum(status == 'Dirty' for status in self.status.values())
+        self.current = random.Random(seed).choice(list(moves)) if start is None else start
+
+    def Sensors(self):  # Sense Environment
+        return (self.current, self.status[self.current])
+
+    def Actuators(self, action):  # Modify Environment
+        if action == 'Suck':
+            if self.status[self.current] == 'Dirty':
+                self.dirty_count -= 1
+            self.status[self.current] = 'Clean'
+        elif action in self.MOVES[self.current]:
+            self.current = self.MOVES[self.current][action]
+
+    def all_clean(self):  # O(1) using the running dirty count
+        return self.dirty_count == 0
+
+
+def run_episode(n, moves=MOVES, seed=None, agent_class=ReflexAgentWithState):
+    '''
+    Run one agent in its own environment until it stops (NoOp) or n steps pass.
+    Return the number of steps before the agent stopped.
+    '''
+    environment = VacuumEnvironment(moves, seed=seed)
+    agent = agent_class(moves, seed=seed)
+    for step in range(n):
+        action = agent(environment.Sensors())
+        if action == 'NoOp':
+            return step
+        environment.Actuators(action)
+    return n
+
+
+def run_agents(n_agents, n=1000, moves=MOVES, processes=None, seed=0, agent_class=ReflexAgentWithState):
+    '''
+    Run n_agents independent agents for at most n steps each. With processes
+    set, episodes are spread over a process pool, otherwise all agents are
+    stepped side by side in one loop. Return the steps taken by every agent.
+    '''
+    seeds = [seed + i for i in range(n_agents)]
+    if processes:
+        with Pool(processes) as pool:
+            return pool.starmap(run_episode, [(n, moves, s, agent_class) for s in seeds],
+                                chunksize=max(1, n_agents // (4 * processes)))
+
+    environments = [VacuumEnvironment(moves, seed=s) for s in seeds]
+    agents = [agent_class(moves, seed=s) for s in seeds]
+    steps = [n] * n_agents
+    active = list(range(n_agents))
+    for step in range(n):
+        still_active = []
+        for i in active:
+            action = agents[i](environments[i].Sensors())
+            if action == 'NoOp':
+                steps[i] = step
+            else:
+                environments[i].Actuators(action)
+                still_active.append(i)
+        active = still_active
+        if not active:
+            break
+    return steps
+
+
+def run(n_agents=10000, n=100):
+    for processes in [None, 4]:
+        steps = run_agents(n_agents, n, processes=processes)
+        print('processes: {} agents: {} mean steps: {:.2f} max steps: {}'.format(
+            processes or 1, n_agents, sum(steps) / n_agents, max(steps)))
+
+
+def run_exploration(sizes=(10, 30, 100)):  # Steps to finish on growing grids, random vs frontier
+    from grid_vacuum import GridMoves
+    print('{:>10s}{:>12s}{:>12s}'.format('grid', 'random', 'frontier'))
+    for size in sizes:
+        moves = GridMoves(size, size)
+        n = 100 * size * size
+        print('{:>10s}{:>12d}{:>12d}'.format(
+            '{0}x{0}'.format(size),
+            run_episode(n, moves, seed=0),
+            run_episode(n, moves, seed=0, agent_class=FrontierReflexAgentWithState)))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,28 @@
+'''
+Small-integer encoding shared by the fast vacuum-world simulators.
+Locations are indices into a list of square names, statuses and actions
+are indices into STATUSES and ACTIONS.
+'''
+
+STATUSES = ['Clean', 'Dirty']
+CLEAN, DIRTY = range(len(STATUSES))
+
+ACTIONS = ['Suck', 'Right', 'Left', 'Up', 'Down', 'NoOp']
+SUCK, RIGHT, LEFT, UP, DOWN, NOOP = range(len(ACTIONS))
+
+# Moves of the two-square world used by reflex_vacuum_agent.py
+TWO_SQUARE_MOVES = {
+    'A': {'Right': 'B'},
+    'B': {'Left': 'A'}
+}
+
+
+def compile_moves(locations, moves):  # MOVES dict -> flat [location * len(ACTIONS) + action] table
+    if hasattr(moves, 'table'):  # Generated maps such as grid_vacuum.GridMoves build their own
+        return moves.table()
+    index = {location: i for i, location in enumerate(locations)}
+    table = [i for i in range(len(locations)) for _ in ACTIONS]  # Invalid moves stay put
+    for location, directions in moves.items():
+        for direction, neighbour in directions.items():
+            table[index[location] * len(ACTIONS) + ACTIONS.index(direction)] = index[neighbour]
+    return table
@@ -1,4 +1,11 @@
+from fringe import make_fringe
+from instrumentation import FINISH, START, SearchStats
+from vacuum_world import VacuumWorld
+
+
 class Node:
+    __slots__ = ('STATE', 'PARENT_NODE', 'DEPTH')  # No per-node __dict__
+
     def __init__(self, state, parent=None, depth=0):
         self.STATE = state
         self.PARENT_NODE = parent
@@ -20,16 +27,15 @@ class Node:
 
 
 def INSERT(node, queue):
-    queue.append(node)  # BFS: insert at end (FIFO)
+    queue.INSERT(node)  # BFS: insert at end (FIFO)
     return queue
 
 def INSERT_ALL(nodes, queue):
-    for node in nodes:
-        queue = INSERT(node, queue)
+    queue.INSERT_ALL(nodes)
     return queue
 
 def REMOVE_FIRST(queue):
-    return queue.pop(0)
+    return queue.REMOVE_FIRST()
 
 def EXPAND(node):
     successors = []
@@ -39,11 +45,12 @@ def EXPAND(node):
         successors.append(s)
     return successors
 
-def successor_fn(state):
-    return STATE_SPACE.get(state, [])
+def successor_fn(state):  # Successors computed on demand instead of looked up in a table
+    return (WORLD.DECODE(child) for child in WORLD.SUCCESSORS(WORLD.ENCODE(state)))
 
-def TREE_SEARCH():
-    fringe = []
+def TREE_SEARCH(strategy='FIFO', stats=None):
+    START(stats)
+    fringe = make_fringe(strategy)
     initial_node = Node(INITIAL_STATE)
     fringe = INSERT(initial_node, fringe)
     visited = set()
@@ -51,36 +58,32 @@ def TREE_SEARCH():
     while fringe:
         node = REMOVE_FIRST(fringe)
         if node.STATE in visited:
+            if stats is not None:
+                stats.DUPLICATE(node.STATE)
             continue
         visited.add(node.STATE)
 
         if node.STATE[1] == 'Clean' and node.STATE[2] == 'Clean':
-            return node.path()
+            return FINISH(stats, node.path())
 
         children = EXPAND(node)
         fringe = INSERT_ALL(children, fringe)
-        print("Fringe:", [n.STATE for n in fringe])
+        if stats is not None:
+            stats.EXPANDED(node, children, fringe)
 
-    return None
+    return FINISH(stats, None)
 
 
 # Define the initial state
 INITIAL_STATE = ('A', 'Dirty', 'Dirty')
 
-# Generate the state space manually
-STATE_SPACE = {
-    ('A', 'Dirty', 'Dirty'): [('A', 'Clean', 'Dirty'), ('B', 'Dirty', 'Dirty')],
-    ('A', 'Clean', 'Dirty'): [('B', 'Clean', 'Dirty')],
-    ('B', 'Clean', 'Dirty'): [('B', 'Clean', 'Clean'), ('A', 'Clean', 'Dirty')],
-    ('B', 'Clean', 'Clean'): [('A', 'Clean', 'Clean')],
-    ('B', 'Dirty', 'Dirty'): [('B', 'Dirty', 'Clean'), ('A', 'Dirty', 'Dirty')],
-    ('B', 'Dirty', 'Clean'): [('B', 'Clean', 'Clean'), ('A', 'Dirty', 'Clean')],
-    ('A', 'Dirty', 'Clean'): [('A', 'Clean', 'Clean'), ('B', 'Dirty', 'Clean')],
-    ('A', 'Clean', 'Clean'): [('B', 'Clean', 'Clean')],
-}
+# Two-room vacuum world; WORLD.STATE_SPACE() shows the full table
+WORLD = VacuumWorld(2)
 
 def run():
-    path = TREE_SEARCH()
+    stats = SearchStats()
+    path = TREE_SEARCH(stats=stats)
+    print(stats)
     if path:
         print('\nSolution path:')
         for node in path:
@@ -0,0 +1,48 @@
+'''
+Peak memory and time of breadth-first search against iterative deepening on
+generated complete trees. States are ints numbered level by level, so the
+children of s are b*s+1 ... b*s+b.
+'''
+import time
+import tracemalloc
+
+from search import GRAPH_SEARCH, ITERATIVE_DEEPENING_SEARCH
+
+
+def tree_successors(branching, depth):  # successor_fn of a complete tree of the given depth
+    first_leaf = (branching ** depth - 1) // (branching - 1)
+    def successors(state):
+        if state >= first_leaf:
+            return []
+        return range(branching * state + 1, branching * state + branching + 1)
+    return successors
+
+
+def measure(search):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    path = search()
+    elapsed = time.perf_counter() - start_time
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(path) - 1, peak, elapsed
+
+
+def run(trees=((2, 12), (3, 9), (4, 7), (10, 5))):
+    print('{:>10s}{:>7s}{:>14s}{:>14s}{:>10s}{:>10s}'.format(
+        'branching', 'depth', 'BFS bytes', 'IDS bytes', 'BFS s', 'IDS s'))
+    for branching, depth in trees:
+        successors = tree_successors(branching, depth)
+        goal = (branching ** (depth + 1) - 1) // (branching - 1) - 1  # Last leaf, worst case for both
+        goal_test = lambda state: state == goal
+        (bfs_depth, bfs_peak, bfs_time) = measure(
+            lambda: GRAPH_SEARCH('FIFO', 0, goal_test, successors))
+        (ids_depth, ids_peak, ids_time) = measure(
+            lambda: ITERATIVE_DEEPENING_SEARCH(None, 0, goal_test, successors))
+        assert bfs_depth == ids_depth == depth
+        print('{:>10d}{:>7d}{:>14,d}{:>14,d}{:>10.3f}{:>10.3f}'.format(
+            branching, depth, bfs_peak, ids_peak, bfs_time, ids_time))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,129 @@
+'''
+STATE_SPACE interned to dense ints and stored in CSR form: the successors of
+state id i are targets[offsets[i]:offsets[i + 1]] (with matching weights for
+weighted spaces such as L3's), so successor generation is a zero-copy slice.
+Graphs over the ints 0 .. n-1 (from_edges) keep no state table at all: a
+state is its own id.
+'''
+import time
+import tracemalloc
+
+import numpy as np
+
+from search import Node
+
+
+class CSRGraph:
+    def __init__(self, states, offsets, targets, weights=None):
+        self.STATES = states  # State id -> state, None when states are their own ids
+        self.state_ids = None if states is None else {state: i for i, state in enumerate(states)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_state_space(cls, state_space, weighted=False):
+        '''
+        Load a STATE_SPACE dict. With weighted=True its entries are
+        (child, cost) pairs as in L3, otherwise plain child states.
+        '''
+        states = list(state_space)
+        state_ids = {state: i for i, state in enumerate(states)}
+        targets = []
+        weights = []
+        offsets = [0]
+        for state in state_space:
+            for entry in state_space[state]:
+                (child, cost) = entry if weighted else (entry, 1)
+                if child not in state_ids:  # Child with no entry of its own
+                    state_ids[child] = len(states)
+                    states.append(child)
+                targets.append(state_ids[child])
+                weights.append(cost)
+            offsets.append(len(targets))
+        offsets += [len(targets)] * (len(states) + 1 - len(offsets))
+        return cls(states, np.array(offsets, dtype=np.int64), np.array(targets, dtype=np.int32),
+                   np.array(weights) if weighted else None)
+
+    @classmethod
+    def from_edges(cls, n, sources, targets, weights=None):  # Graph over states 0 .. n-1 from edge arrays
+        order = np.argsort(sources, kind='stable')
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+        return cls(None, offsets, np.asarray(targets, dtype=np.int32)[order],
+                   None if weights is None else np.asarray(weights)[order])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def state_id(self, state):
+        return state if self.state_ids is None else self.state_ids[state]
+
+    def STATE(self, state_id):
+        return int(state_id) if self.STATES is None else self.STATES[state_id]
+
+    def successors(self, state_id):  # successor_fn over state ids
+        return self.targets[self.offsets[state_id]:self.offsets[state_id + 1]]
+
+    def weighted_successors(self, state_id):  # (child ids, edge costs)
+        start, end = self.offsets[state_id], self.offsets[state_id + 1]
+        return self.targets[start:end], self.weights[start:end]
+
+
+'''
+Breadth-first search over a CSRGraph, one whole layer per step with NumPy.
+Return path to goal like Node.path(), or None on failure.
+'''
+def CSR_BREADTH_FIRST_SEARCH(graph, initial_state, goal_state):
+    start, goal = graph.state_id(initial_state), graph.state_id(goal_state)
+    parent = np.full(len(graph), -2, dtype=np.int64)  # -2: not reached, -1: root
+    parent[start] = -1
+    layer = np.array([start])
+    while layer.size and parent[goal] == -2:
+        begin = graph.offsets[layer]
+        counts = graph.offsets[layer + 1] - begin
+        # Index into targets of every edge leaving the layer
+        edges = np.repeat(begin - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        children = graph.targets[edges]
+        new = parent[children] == -2
+        (children, first) = np.unique(children[new], return_index=True)
+        parent[children] = np.repeat(layer, counts)[new][first]
+        layer = children
+    if parent[goal] == -2:
+        return None
+    states = []
+    state = goal
+    while state != -1:
+        states.append(graph.STATE(state))
+        state = parent[state]
+    node = None
+    for depth, state in enumerate(reversed(states)):
+        node = Node(state, node, depth)
+    return node.path()
+
+
+def run(n=1000000, degree=5, seed=0):
+    from search import GRAPH_SEARCH, STATE_SPACE
+    print(CSR_BREADTH_FIRST_SEARCH(CSRGraph.from_state_space(STATE_SPACE), 'A', 'J'))
+
+    rng = np.random.default_rng(seed)
+    sources = np.repeat(np.arange(n), degree)
+    targets = rng.integers(0, n, n * degree)
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    graph = CSRGraph.from_edges(n, sources, targets)
+    elapsed = time.perf_counter() - start_time
+    (footprint, _) = tracemalloc.get_traced_memory()  # Everything the graph still holds
+    tracemalloc.stop()
+    print('loaded {:,} states, {:,} edges in {:.2f}s, {:.1f} MB'.format(n, n * degree, elapsed, footprint / 1e6))
+    adjacency = {state: targets[state * degree:(state + 1) * degree].tolist() for state in range(n)}
+    for name, search in [
+            ('dict GRAPH_SEARCH', lambda: GRAPH_SEARCH('FIFO', 0, lambda state: state == n - 1, adjacency.__getitem__)),
+            ('CSR layer BFS', lambda: CSR_BREADTH_FIRST_SEARCH(graph, 0, n - 1))]:
+        start_time = time.perf_counter()
+        path = search()
+        print('{:20s} depth {} in {:.2f}s'.format(name, path[0].DEPTH, time.perf_counter() - start_time))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,165 @@
+'''
+External-memory breadth-first search for state spaces larger than RAM.
+States are packed uint64 ids. Each BFS layer is written to disk as sorted
+bucket files (bucket = id % buckets) that are read back as memory maps.
+Duplicates are removed by sorting each bucket of candidates and merging it
+against the same bucket of earlier layers with a binary search, so only one
+bucket of candidates is ever held in memory.
+
+expand(ids) maps an array of state ids to the array of all their successor
+ids, and goal_test(ids) to a boolean mask.
+'''
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from search import Node
+
+
+def LAYER_FILE(directory, depth, bucket):
+    return os.path.join(directory, 'layer{}_bucket{}.u64'.format(depth, bucket))
+
+
+def READ_LAYER(directory, depth, bucket):  # Sorted ids of one bucket of a layer, memory-mapped
+    path = LAYER_FILE(directory, depth, bucket)
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=np.uint64)
+    return np.memmap(path, dtype=np.uint64, mode='r')
+
+
+def LAYER_CHUNKS(directory, depth, buckets, chunk_size):  # Stream a whole layer in chunks
+    for bucket in range(buckets):
+        layer = READ_LAYER(directory, depth, bucket)
+        for start in range(0, len(layer), chunk_size):
+            yield np.array(layer[start:start + chunk_size])
+
+
+def EXTERNAL_BFS(initial_state, expand, goal_test=None, directory=None, buckets=16,
+                 chunk_size=1 << 20, locality=None):
+    '''
+    Breadth-first search from initial_state with layers kept on disk.
+    Layer files go to a fresh temporary directory (inside directory, if
+    given) that is removed afterwards. locality limits how many earlier
+    layers are checked for duplicates (2 is enough for undirected graphs);
+    None checks them all.
+    Return a dict with the goal id, its depth and path like Node.path()
+    (None without a goal), and the size of every layer.
+    '''
+    directory = tempfile.mkdtemp(prefix='external_bfs_', dir=directory)
+    result = {'goal': None, 'depth': None, 'path': None, 'layers': [1]}
+    try:
+        for bucket in range(buckets):
+            np.array([initial_state] if initial_state % buckets == bucket else [],
+                     dtype=np.uint64).tofile(LAYER_FILE(directory, 0, bucket))
+        depth = 0
+        goal = initial_state if goal_test is not None and goal_test(np.array([initial_state], dtype=np.uint64))[0] else None
+        while goal is None and result['layers'][-1]:
+            # Spill the successors of the whole layer into one candidate file per bucket
+            spills = [open(os.path.join(directory, 'candidates{}.u64'.format(bucket)), 'wb')
+                      for bucket in range(buckets)]
+            for chunk in LAYER_CHUNKS(directory, depth, buckets, chunk_size):
+                children = expand(chunk).astype(np.uint64)
+                owners = children % np.uint64(buckets)
+                for bucket in range(buckets):
+                    children[owners == bucket].tofile(spills[bucket])
+            for spill in spills:
+                spill.close()
+
+            depth += 1
+            size = 0
+            first = 0 if locality is None else max(0, depth - locality)
+            for bucket in range(buckets):
+                path = spills[bucket].name
+                candidates = np.unique(np.fromfile(path, dtype=np.uint64))
+                os.remove(path)
+                for previous in range(first, depth):  # Sort-and-merge duplicate detection
+                    layer = READ_LAYER(directory, previous, bucket)
+                    if len(layer) and len(candidates):
+                        index = np.minimum(np.searchsorted(layer, candidates), len(layer) - 1)
+                        candidates = candidates[layer[index] != candidates]
+                candidates.tofile(LAYER_FILE(directory, depth, bucket))
+                size += len(candidates)
+                if goal is None and goal_test is not None and len(candidates):
+                    found = np.flatnonzero(goal_test(candidates))
+                    if len(found):
+                        goal = int(candidates[found[0]])
+            result['layers'].append(size)
+
+        if goal is not None:
+            result['goal'] = goal
+            result['depth'] = depth
+            result['path'] = RECONSTRUCT_PATH(goal, depth, expand, directory, buckets, chunk_size)
+        elif not result['layers'][-1]:
+            result['layers'].pop()
+        return result
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def FIND_PARENT(chunk, child, expand):
+    '''
+    A state of chunk with child among its successors, or None. The whole
+    chunk is expanded at once; on a hit it is halved until one state is left,
+    so finding the parent costs about two expansions of the chunk.
+    '''
+    child = np.uint64(child)
+    if not np.any(expand(chunk) == child):
+        return None
+    while len(chunk) > 1:
+        half = chunk[:len(chunk) // 2]
+        chunk = half if np.any(expand(half) == child) else chunk[len(chunk) // 2:]
+    return int(chunk[0])
+
+
+def RECONSTRUCT_PATH(goal, depth, expand, directory, buckets, chunk_size):
+    '''
+    Walk back one layer at a time, scanning the previous layer chunk by
+    chunk for a state with the current one among its successors.
+    '''
+    states = [goal]
+    for previous in range(depth - 1, -1, -1):
+        for chunk in LAYER_CHUNKS(directory, previous, buckets, chunk_size):
+            parent = FIND_PARENT(chunk, states[-1], expand)
+            if parent is not None:
+                states.append(parent)
+                break
+    node = None
+    for level, state in enumerate(reversed(states)):
+        node = Node(state, node, level)
+    return node.path()
+
+
+def VACUUM_EXPANDER(world):  # Vectorized VacuumWorld.SUCCESSOR_IDS over uint64 arrays
+    rooms = np.uint64(world.N_ROOMS)
+    step = np.uint64(1) << rooms
+    def expand(ids):
+        location = ids >> rooms
+        here = np.uint64(1) << location
+        dirty = (ids & here) != 0
+        return np.concatenate([(ids & ~here)[dirty], ids[location > 0] - step,
+                               ids[location < rooms - np.uint64(1)] + step])
+    return expand
+
+
+def VACUUM_GOAL_TEST(world):  # Vectorized VacuumWorld.GOAL_TEST_ID
+    mask = np.uint64((1 << world.N_ROOMS) - 1)
+    return lambda ids: (ids & mask) == 0
+
+
+def run(rooms=20):
+    from vacuum_world import VacuumWorld
+    world = VacuumWorld(rooms)
+    start_time = time.perf_counter()
+    # Moves are reversible and a Suck never needs undoing, so no duplicate is older than two layers
+    result = EXTERNAL_BFS(world.STATE_ID(world.INITIAL_STATE()), VACUUM_EXPANDER(world),
+                          VACUUM_GOAL_TEST(world), locality=2)
+    print('{} rooms ({:,} states): goal at depth {}, {:,} states reached in {:.2f}s'.format(
+        rooms, len(world), result['depth'], sum(result['layers']), time.perf_counter() - start_time))
+    print('path:', [world.FROM_STATE_ID(node.STATE) for node in reversed(result['path'])][:6], '...')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,69 @@
+'''
+Fringe strategies for TREE_SEARCH. Each one supports INSERT, INSERT_ALL and
+REMOVE_FIRST in O(1), or O(log n) for the priority fringe, instead of the
+O(n) list.insert(0, ...) / list.pop(0).
+'''
+import heapq
+import itertools
+from collections import deque
+
+
+class FifoFringe:  # Breadth-first: remove the oldest node
+    def __init__(self):
+        self.queue = deque()
+
+    def INSERT(self, node):
+        self.queue.append(node)
+
+    def INSERT_ALL(self, nodes):
+        self.queue.extend(nodes)
+
+    def REMOVE_FIRST(self):
+        return self.queue.popleft()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __iter__(self):  # Nodes in removal order
+        return iter(self.queue)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class LifoFringe(FifoFringe):  # Depth-first: remove the newest node, children left to right
+    def INSERT_ALL(self, nodes):
+        self.queue.extend(reversed(nodes))
+
+    def REMOVE_FIRST(self):
+        return self.queue.pop()
+
+    def __iter__(self):
+        return reversed(self.queue)
+
+
+class PriorityFringe(FifoFringe):  # Remove the node with the lowest key, ties in insertion order
+    def __init__(self, key=lambda node: node.DEPTH):
+        self.queue = []
+        self.key = key
+        self.counter = itertools.count()
+
+    def INSERT(self, node):
+        heapq.heappush(self.queue, (self.key(node), next(self.counter), node))
+
+    def INSERT_ALL(self, nodes):
+        for node in nodes:
+            self.INSERT(node)
+
+    def REMOVE_FIRST(self):
+        return heapq.heappop(self.queue)[2]
+
+    def __iter__(self):
+        return (node for (_, _, node) in sorted(self.queue))
+
+
+FRINGES = {'FIFO': FifoFringe, 'LIFO': LifoFringe, 'PRIORITY': PriorityFringe}
+
+
+def make_fringe(strategy, **kwargs):  # e.g. make_fringe('PRIORITY', key=lambda node: node.DEPTH)
+    return FRINGES[strategy](**kwargs)
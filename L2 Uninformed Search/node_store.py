@@ -0,0 +1,68 @@
+'''
+Struct-of-arrays node store. Instead of one Node object per generated node,
+the store keeps state id, parent index and depth in array('i') columns
+(12 bytes per node), interning every distinct state once. Node objects and
+paths are only built when a path is asked for.
+'''
+from array import array
+
+from search import Node
+
+
+class NodeStore:
+    def __init__(self):
+        self.STATES = []  # State id -> state
+        self.state_ids = {}  # State -> state id
+        self.state = array('i')
+        self.parent = array('i')  # -1 for the root
+        self.depth = array('i')
+
+    def __len__(self):
+        return len(self.state)
+
+    def intern(self, state):  # State id of state, adding it if new
+        state_id = self.state_ids.get(state)
+        if state_id is None:
+            state_id = self.state_ids[state] = len(self.STATES)
+            self.STATES.append(state)
+        return state_id
+
+    def add(self, state, parent=-1):  # Store a node and return its index
+        self.state.append(self.intern(state))
+        self.parent.append(parent)
+        self.depth.append(self.depth[parent] + 1 if parent >= 0 else 0)
+        return len(self.state) - 1
+
+    def STATE(self, index):
+        return self.STATES[self.state[index]]
+
+    def path(self, index):  # Same as Node.path(): nodes from index back to the root
+        indices = []
+        while index >= 0:
+            indices.append(index)
+            index = self.parent[index]
+        node = None
+        for i in reversed(indices):
+            node = Node(self.STATE(i), node, self.depth[i])
+        return node.path()
+
+
+'''
+Breadth-first search over a NodeStore. Nodes are stored in the order they are
+generated, so the fringe is just the range of indices not yet expanded and
+needs no separate queue. With graph=True states already stored are skipped.
+Return path to goal, or None on failure.
+'''
+def STORE_BREADTH_FIRST_SEARCH(initial_state, goal_test, successors, graph=True):
+    store = NodeStore()
+    store.add(initial_state)
+    head = 0
+    while head < len(store):
+        state = store.STATE(head)
+        if goal_test(state):
+            return store.path(head)
+        for child in successors(state):
+            if not graph or child not in store.state_ids:
+                store.add(child, head)
+        head += 1
+    return None
@@ -0,0 +1,138 @@
+'''
+Level-synchronous parallel breadth-first search over implicit graphs.
+Every worker process owns one hash partition of the state space: the reached
+states of that partition (with their parents) and its part of the frontier.
+Each level all workers expand their frontier in parallel and bucket the
+successors by owner; the buckets are then routed to their owners, which drop
+duplicates against their own reached set. Workers pickle every bucket
+themselves and the main process forwards the bytes untouched, so it never
+unpickles or rebuilds the states.
+
+successors and goal_test are sent to the workers, so they must be picklable
+(module-level functions or methods of picklable objects such as VacuumWorld).
+'''
+import pickle
+import time
+import zlib
+from multiprocessing import Pipe, Process
+
+from search import Node
+
+
+def PARTITION(state, partitions):  # Owner of state, the same in every process
+    if isinstance(state, int):
+        return state % partitions
+    return zlib.crc32(repr(state).encode()) % partitions  # hash() of str differs between processes
+
+
+def WORKER(connection, partitions, successors, goal_test):
+    parents = {}  # Reached states of this partition -> parent state
+    frontier = []
+    while True:
+        (command, argument) = connection.recv()
+        if command == 'expand':  # Successors of the frontier, bucketed by owner
+            buckets = [[] for _ in range(partitions)]
+            for state in frontier:
+                for child in successors(state):
+                    buckets[PARTITION(child, partitions)].append((child, state))
+            for bucket in buckets:
+                connection.send_bytes(pickle.dumps(bucket, pickle.HIGHEST_PROTOCOL))
+        elif command == 'merge':  # Keep the new states of argument pickled buckets as the next frontier
+            frontier = []
+            goal = None
+            for _ in range(argument):
+                for (child, parent) in pickle.loads(connection.recv_bytes()):
+                    if child not in parents:
+                        parents[child] = parent
+                        frontier.append(child)
+                        if goal is None and goal_test is not None and goal_test(child):
+                            goal = child
+            connection.send((len(frontier), goal))
+        elif command == 'parent':
+            connection.send(parents[argument])
+        elif command == 'stop':
+            connection.close()
+            return
+
+
+def PARALLEL_BFS(initial_state, successors, goal_test=None, processes=4):
+    '''
+    Breadth-first search from initial_state on processes workers.
+    Return path to the shallowest goal like Node.path() (None on failure),
+    or with goal_test=None the number of reachable states.
+    '''
+    connections = []
+    workers = []
+    for _ in range(processes):
+        (parent_end, child_end) = Pipe()
+        worker = Process(target=WORKER, args=(child_end, processes, successors, goal_test), daemon=True)
+        worker.start()
+        child_end.close()  # Only the worker holds it now, so its death gives EOF here
+        connections.append(parent_end)
+        workers.append(worker)
+    try:
+        empty = pickle.dumps([], pickle.HIGHEST_PROTOCOL)
+        incoming = [[empty] for _ in range(processes)]  # Pickled buckets for every owner
+        incoming[PARTITION(initial_state, processes)] = [pickle.dumps([(initial_state, None)], pickle.HIGHEST_PROTOCOL)]
+        reached = 0
+        while True:
+            for connection, buckets in zip(connections, incoming):
+                connection.send(('merge', len(buckets)))
+                for bucket in buckets:
+                    connection.send_bytes(bucket)
+            results = [connection.recv() for connection in connections]
+            reached += sum(count for count, _ in results)
+            goals = [goal for _, goal in results if goal is not None]
+            if goals:
+                return BUILD_PATH(goals[0], connections)
+            if not any(count for count, _ in results):
+                return None if goal_test is not None else reached
+            for connection in connections:
+                connection.send(('expand', None))
+            incoming = [[] for _ in range(processes)]
+            for connection in connections:  # Forwarded as bytes, never unpickled here
+                for owner in range(processes):
+                    incoming[owner].append(connection.recv_bytes())
+    except (EOFError, OSError) as error:  # A worker died, e.g. successors or goal_test raised
+        raise RuntimeError('PARALLEL_BFS worker exited unexpectedly') from error
+    finally:
+        for connection in connections:
+            try:
+                connection.send(('stop', None))
+            except OSError:  # That worker is already gone
+                pass
+            connection.close()
+        for worker in workers:
+            worker.join()
+
+
+def BUILD_PATH(goal, connections):  # Follow parents back through the owning workers
+    states = []
+    state = goal
+    while state is not None:
+        states.append(state)
+        connection = connections[PARTITION(state, len(connections))]
+        connection.send(('parent', state))
+        state = connection.recv()
+    node = None
+    for depth, state in enumerate(reversed(states)):
+        node = Node(state, node, depth)
+    return node.path()
+
+
+def run(rooms=16, processes=4):
+    from search import GRAPH_SEARCH
+    from vacuum_world import VacuumWorld
+    world = VacuumWorld(rooms)
+    initial_state = world.STATE_ID(world.INITIAL_STATE())
+    for name, search in [
+            ('GRAPH_SEARCH', lambda: len(GRAPH_SEARCH('FIFO', initial_state, world.GOAL_TEST_ID, world.SUCCESSOR_IDS)) - 1),
+            ('PARALLEL_BFS', lambda: len(PARALLEL_BFS(initial_state, world.SUCCESSOR_IDS, world.GOAL_TEST_ID, processes)) - 1),
+            ('reachable states', lambda: PARALLEL_BFS(initial_state, world.SUCCESSOR_IDS, None, processes))]:
+        start_time = time.perf_counter()
+        result = search()
+        print('{:18s}{:>12,d}{:>8.2f}s'.format(name, result, time.perf_counter() - start_time))
+
+
+if __name__ == '__main__':
+    run()
@@ -1,4 +1,12 @@
+import itertools
+
+from fringe import make_fringe
+from instrumentation import FINISH, START, SearchStats
+
+
 class Node:  # Node has only PARENT_NODE, STATE, DEPTH
+    __slots__ = ('STATE', 'PARENT_NODE', 'DEPTH')  # No per-node __dict__
+
     def __init__(self, state, parent=None, depth=0):
         self.STATE = state
         self.PARENT_NODE = parent
@@ -20,19 +28,161 @@ class Node:  # Node has only PARENT_NODE, STATE, DEPTH
 
 
 '''
-Search the tree for the goal state and return path from initial state to goal state
+Search the tree for the goal state and return path from initial state to goal state.
+strategy selects the fringe: 'LIFO' (depth-first), 'FIFO' (breadth-first) or 'PRIORITY'.
+Pass stats=SearchStats() from instrumentation to count or trace the search.
 '''
-def TREE_SEARCH():
-    fringe = []
+def TREE_SEARCH(strategy='LIFO', stats=None):
+    START(stats)
+    fringe = make_fringe(strategy)
     initial_node = Node(INITIAL_STATE)
     fringe = INSERT(initial_node, fringe)
-    while fringe is not None:
+    while fringe:
         node = REMOVE_FIRST(fringe)
         if node.STATE == GOAL_STATE:
-            return node.path()
+            return FINISH(stats, node.path())
         children = EXPAND(node)
         fringe = INSERT_ALL(children, fringe)
-        print("fringe: {}".format(fringe))
+        if stats is not None:
+            stats.EXPANDED(node, children, fringe)
+    return FINISH(stats, None)  # Failure: fringe exhausted
+
+
+'''
+Graph search: like TREE_SEARCH, but a hashed set of reached states drops
+duplicates when they are generated, so every state is expanded at most once.
+Defaults to the module's INITIAL_STATE, GOAL_STATE and successor_fn.
+Return path to goal, or None on failure.
+'''
+def GRAPH_SEARCH(strategy='LIFO', initial_state=None, goal_test=None, successors=None, stats=None):
+    START(stats)
+    if initial_state is None:
+        initial_state = INITIAL_STATE
+    goal_test = goal_test or (lambda state: state == GOAL_STATE)
+    successors = successors or successor_fn
+    fringe = INSERT(Node(initial_state), make_fringe(strategy))
+    reached = {initial_state}  # Closed set plus fringe
+    while fringe:
+        node = REMOVE_FIRST(fringe)
+        if goal_test(node.STATE):
+            return FINISH(stats, node.path())
+        children = []
+        for child in successors(node.STATE):
+            if child not in reached:
+                reached.add(child)
+                children.append(Node(child, node, node.DEPTH + 1))
+            elif stats is not None:
+                stats.DUPLICATE(child)
+        fringe = INSERT_ALL(children, fringe)
+        if stats is not None:
+            stats.EXPANDED(node, children, fringe)
+    return FINISH(stats, None)
+
+
+CUTOFF = 'cutoff'  # Returned when the depth limit stopped the search
+
+
+'''
+Depth-limited search. Only the current path is stored, each node with an
+iterator over its successors, so memory is O(limit x branching).
+Return path to goal, CUTOFF if nodes were left unexpanded at the limit,
+or None on failure.
+'''
+def DEPTH_LIMITED_SEARCH(limit, initial_state=None, goal_test=None, successors=None):
+    if initial_state is None:
+        initial_state = INITIAL_STATE
+    goal_test = goal_test or (lambda state: state == GOAL_STATE)
+    successors = successors or successor_fn
+    root = Node(initial_state)
+    if goal_test(root.STATE):
+        return root.path()
+    cutoff = False
+    stack = [(root, iter(successors(root.STATE)))] if limit > 0 else []
+    while stack:
+        (node, children) = stack[-1]
+        child = next(children, stack)  # The stack itself marks exhausted children
+        if child is stack:
+            stack.pop()
+            continue
+        child_node = Node(child, node, node.DEPTH + 1)
+        if goal_test(child):
+            return child_node.path()
+        if child_node.DEPTH < limit:
+            stack.append((child_node, iter(successors(child))))
+        elif not cutoff and HAS_SUCCESSORS(child, successors):
+            cutoff = True
+    return CUTOFF if cutoff or (limit == 0 and HAS_SUCCESSORS(root.STATE, successors)) else None
+
+
+def HAS_SUCCESSORS(state, successors):  # Works for lists and generators alike
+    for _ in successors(state):
+        return True
+    return False
+
+
+'''
+Iterative deepening: DEPTH_LIMITED_SEARCH with limits 0, 1, 2, ... until it
+does not cut off. Finds a shallowest goal with the memory of depth-first search.
+'''
+def ITERATIVE_DEEPENING_SEARCH(max_depth=None, initial_state=None, goal_test=None, successors=None):
+    for depth in itertools.count():
+        result = DEPTH_LIMITED_SEARCH(depth, initial_state, goal_test, successors)
+        if result != CUTOFF or depth == max_depth:
+            return result
+
+
+'''
+Bidirectional breadth-first search for a single GOAL_STATE. Grows a frontier
+from each end, always expanding the smaller one by a whole layer, and stops
+when the frontiers meet: O(b^(d/2)) expansions instead of O(b^d).
+Return path to goal, or None on failure.
+'''
+def BIDIRECTIONAL_SEARCH(initial_state=None, goal_state=None, successors=None, predecessors=None):
+    if initial_state is None:
+        initial_state = INITIAL_STATE
+    if goal_state is None:
+        goal_state = GOAL_STATE
+    successors = successors or successor_fn
+    predecessors = predecessors or predecessor_fn
+    forward = {initial_state: None}  # State -> parent towards initial_state
+    backward = {goal_state: None}  # State -> parent towards goal_state
+    forward_layer = [initial_state]
+    backward_layer = [goal_state]
+    meet = initial_state if initial_state == goal_state else None
+    while meet is None and forward_layer and backward_layer:
+        if len(forward_layer) <= len(backward_layer):
+            (forward_layer, meet) = EXPAND_LAYER(forward_layer, forward, backward, successors)
+        else:
+            (backward_layer, meet) = EXPAND_LAYER(backward_layer, backward, forward, predecessors)
+    if meet is None:
+        return None
+
+    states = []
+    state = meet
+    while state is not None:  # meet back to initial_state
+        states.append(state)
+        state = forward[state]
+    states.reverse()
+    state = backward[meet]
+    while state is not None:  # meet on to goal_state
+        states.append(state)
+        state = backward[state]
+    node = None
+    for depth, state in enumerate(states):
+        node = Node(state, node, depth)
+    return node.path()
+
+
+def EXPAND_LAYER(layer, parents, other_parents, successors):  # Return (next layer, meeting state or None)
+    next_layer = []
+    for state in layer:
+        for child in successors(state):
+            if child not in parents:
+                parents[child] = state
+                if child in other_parents:
+                    return next_layer, child
+                next_layer.append(child)
+    return next_layer, None
 
 
 '''
@@ -43,25 +193,21 @@ def EXPAND(node):
     successors = []
     children = successor_fn(node.STATE)
     for child in children:
-        s = Node(node)  # create node for each in state list
-        s.STATE = child  # e.g. result = 'F' then 'G' from list ['F', 'G']
-        s.PARENT_NODE = node
-        s.DEPTH = node.DEPTH + 1
-        successors = INSERT(s, successors)
+        s = Node(child, node, node.DEPTH + 1)  # create node for each in state list
+        successors.append(s)
     return successors
 
 
-def INSERT(node, queue):
-    queue.insert(0, node)  # Insert at front (like a stack for DFS)
+def INSERT(node, queue):  # Insert according to the fringe strategy
+    queue.INSERT(node)
     return queue
 
-def INSERT_ALL(nodes, queue):
-    for node in reversed(nodes):  # Maintain left-to-right order
-        queue = INSERT(node, queue)
+def INSERT_ALL(nodes, queue):  # Children come out left to right
+    queue.INSERT_ALL(nodes)
     return queue
 
 def REMOVE_FIRST(queue):
-    return queue.pop(0)  # Remove from front
+    return queue.REMOVE_FIRST()
 
     '''
     Successor function, mapping the nodes to its successors
@@ -70,19 +216,37 @@ def successor_fn(state):  # Lookup list of successor states
     return STATE_SPACE[state]  # successor_fn( 'C' ) returns ['F', 'G']
 
 
+def REVERSE_INDEX(state_space):  # Map every state to the states that lead to it
+    predecessors = {state: [] for state in state_space}
+    for state, children in state_space.items():
+        for child in children:
+            predecessors.setdefault(child, []).append(state)
+    return predecessors
+
+
+def predecessor_fn(state):  # Lookup list of predecessor states
+    return PREDECESSORS.get(state, [])  # predecessor_fn( 'G' ) returns ['C']
+
+
 INITIAL_STATE = 'A'
 GOAL_STATE = 'J'
 STATE_SPACE = {'A': ['B', 'C'],
                'B': ['D', 'E'], 'C': ['F', 'G'],
                'D': [], 'E': [], 'F': [], 'G': ['H', 'I', 'J'],
                'H': [], 'I': [], 'J': [], }
+PREDECESSORS = REVERSE_INDEX(STATE_SPACE)  # Built once for BIDIRECTIONAL_SEARCH
 
 
 '''
 Run tree search and display the nodes in the path to goal node
 '''
 def run():
-    path = TREE_SEARCH()
+    stats = SearchStats()
+    path = TREE_SEARCH(stats=stats)
+    print(stats)
+    if path is None:
+        print('No solution found.')
+        return
     print('Solution path:')
     for node in path:
         node.display()
@@ -0,0 +1,77 @@
+'''
+N-room vacuum world (rooms in a row) with successors computed on demand.
+A state is (location, dirt) where bit i of dirt is set while room i is
+Dirty, so the N * 2^N states never have to be written out as a table.
+ENCODE/DECODE convert to the ('A', 'Dirty', 'Clean') tuples used by the
+hand-written STATE_SPACE tables.
+The lecture folders do not import each other, so this file is kept
+identical in 'L2 Uninformed Search' and 'L3'.
+'''
+
+
+class VacuumWorld:
+    def __init__(self, rooms=2):
+        self.N_ROOMS = rooms
+        self.ROOMS = [chr(ord('A') + i) for i in range(rooms)] if rooms <= 26 else list(range(rooms))
+
+    def SUCCESSORS(self, state):  # Suck (if Dirty), Left, Right; moves into a wall are left out
+        (location, dirt) = state
+        if dirt >> location & 1:
+            yield (location, dirt & ~(1 << location))
+        if location > 0:
+            yield (location - 1, dirt)
+        if location < self.N_ROOMS - 1:
+            yield (location + 1, dirt)
+
+    def GOAL_TEST(self, state):  # Every room Clean
+        return state[1] == 0
+
+    def INITIAL_STATE(self, location=0):  # Every room Dirty
+        return (location, (1 << self.N_ROOMS) - 1)
+
+    def __len__(self):  # Number of states
+        return self.N_ROOMS << self.N_ROOMS
+
+    def STATE_ID(self, state):  # Dense int in range(len(self))
+        (location, dirt) = state
+        return location << self.N_ROOMS | dirt
+
+    def FROM_STATE_ID(self, state_id):
+        return (state_id >> self.N_ROOMS, state_id & ((1 << self.N_ROOMS) - 1))
+
+    def SUCCESSOR_IDS(self, state_id):  # SUCCESSORS over state ids, straight on the bits
+        location = state_id >> self.N_ROOMS
+        successors = []
+        if state_id >> location & 1:
+            successors.append(state_id & ~(1 << location))
+        if location > 0:
+            successors.append(state_id - (1 << self.N_ROOMS))
+        if location < self.N_ROOMS - 1:
+            successors.append(state_id + (1 << self.N_ROOMS))
+        return successors
+
+    def GOAL_TEST_ID(self, state_id):
+        return state_id & ((1 << self.N_ROOMS) - 1) == 0
+
+    def ENCODE(self, state):  # ('B', 'Clean', 'Dirty') -> (1, 0b10)
+        (location, *statuses) = state
+        return (self.ROOMS.index(location), sum(1 << i for i, status in enumerate(statuses) if status == 'Dirty'))
+
+    def DECODE(self, state):  # (1, 0b10) -> ('B', 'Clean', 'Dirty')
+        (location, dirt) = state
+        return (self.ROOMS[location],) + tuple('Dirty' if dirt >> i & 1 else 'Clean' for i in range(self.N_ROOMS))
+
+    def STATE_SPACE(self):  # Materialized STATE_SPACE dict in decoded form, for small worlds only
+        return {self.DECODE(state): [self.DECODE(child) for child in self.SUCCESSORS(state)]
+                for state in map(self.FROM_STATE_ID, range(len(self)))}
+
+
+def run(sizes=(2, 4, 8, 16, 32)):
+    for state, successors in VacuumWorld(2).STATE_SPACE().items():  # The table that used to be written by hand
+        print(state, '->', successors)
+    for rooms in sizes:
+        print('{:>3d} rooms: {:,} states'.format(rooms, len(VacuumWorld(rooms))))
+
+
+if __name__ == '__main__':
+    run()
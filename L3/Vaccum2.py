@@ -1,6 +1,11 @@
-import queue
+import heapq
+import itertools
+
+from instrumentation import FINISH, START, SearchStats
 
 class Node:  # Node has only PARENT_NODE, STATE, DEPTH
+    __slots__ = ('STATE', 'PARENT_NODE', 'DEPTH', 'HEURISTIC', 'EDGE')  # No per-node __dict__
+
     def __init__(self, state, parent=None, depth=0, heuristic=0, edge=0):
         self.STATE = state
         self.PARENT_NODE = parent
@@ -22,25 +27,25 @@ class Node:  # Node has only PARENT_NODE, STATE, DEPTH
     def __repr__(self):
         return 'State: ' + str(self.STATE) + ' - Depth: ' + str(self.DEPTH)
 
-    def __lt__(self, other):
-        return self.HEURISTIC < other.HEURISTIC
-
 '''
 Search the tree for the goal state and return path from initial state to goal state
 '''
 algorithmChoice = 1
 
-def TREE_SEARCH():
-    fringe = queue.PriorityQueue()
+def TREE_SEARCH(stats=None):  # stats=SearchStats(trace_every=1) prints the fringe as before
+    START(stats)
+    fringe = []  # Heap of (cost, tie-breaker, node), single-threaded so no locking
     initial_node = Node(INITIAL_STATE)
     fringe = INSERT_GREEDY(initial_node, fringe)
-    while fringe is not None:
+    while fringe:
         node = REMOVE_FIRST_GREEDY(fringe)
         if GOAL_STATE.__contains__(node.STATE):
-            return node.path()
+            return FINISH(stats, node.path())
         children = EXPAND(node)
         fringe = INSERT_ALL_GREEDY(children, fringe)
-        print("fringe: {}".format(list(fringe.queue)))
+        if stats is not None:
+            stats.EXPANDED(node, children, fringe)
+    return FINISH(stats, None)
 
 
 '''
@@ -51,12 +56,8 @@ def EXPAND(node: Node):
     successors = []
     children = successor_fn(node.STATE)
     for child in children:
-        s = Node(node)  # create node for each in state list
-        s.STATE = child[0]  # e.g. result = 'F' then 'G' from list ['F', 'G']
-        s.PARENT_NODE = node
-        s.HEURISTIC = HEURISTICS_DICT[s.STATE]
-        s.EDGE = child[1] + node.EDGE
-        s.DEPTH = node.DEPTH + 1
+        (state, edge) = child  # e.g. ['B', 1] from [['B', 1], ['C', 2], ['D', 4]]
+        s = Node(state, node, node.DEPTH + 1, HEURISTICS_DICT[state], edge + node.EDGE)
         successors = INSERT(s, successors)
     return successors
 
@@ -68,9 +69,11 @@ def INSERT(node, queue):
     queue.append(node)
     return queue
 
-def INSERT_GREEDY(node, queue: queue.PriorityQueue):
+COUNTER = itertools.count()  # Tie-breaker, equal costs come out in insertion order
+
+def INSERT_GREEDY(node, queue):
     cost = CALCULATE_GREEDY_COST(node)
-    queue.put((cost, node))
+    heapq.heappush(queue, (cost, next(COUNTER), node))
     return queue
 
 def CALCULATE_GREEDY_COST(node):
@@ -97,10 +100,10 @@ def INSERT_ALL(list, queue):
 '''
 Insert list of nodes into the fringe using greedy cost function
 '''
-def INSERT_ALL_GREEDY(list, queue: queue.PriorityQueue):
+def INSERT_ALL_GREEDY(list, queue):
     for i in list:
         cost = CALCULATE_GREEDY_COST(i)
-        queue.put((cost, i))
+        heapq.heappush(queue, (cost, next(COUNTER), i))
     return queue
 
 
@@ -111,9 +114,9 @@ def REMOVE_FIRST(queue):
     return queue.pop(len(queue) - 1)
 
 
-def REMOVE_FIRST_GREEDY(queue: queue.PriorityQueue):
-    item = queue.get()
-    return item[1]
+def REMOVE_FIRST_GREEDY(queue):
+    item = heapq.heappop(queue)
+    return item[2]
 '''
 Successor function, mapping the nodes to its successors
 '''
@@ -148,8 +151,8 @@ HEURISTICS_DICT = {
 '''
 Run tree search and display the nodes in the path to goal node
 '''
-def run():
-    path = TREE_SEARCH()
+def run(trace=False):
+    path = TREE_SEARCH(SearchStats(trace_every=1) if trace else None)
     print('Solution path:')
     for node in path:
         node.display()
@@ -0,0 +1,80 @@
+'''
+Indexed binary min-heap: at most one entry per item, and a position index so
+an item already in the heap can have its priority lowered in place
+(decrease-key). The heap never grows beyond the number of distinct items.
+Equal priorities come out in insertion order.
+'''
+import itertools
+
+
+class IndexedHeap:
+    def __init__(self):
+        self.heap = []  # [priority, tie-breaker, item]
+        self.position = {}  # Item -> index in heap
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def priority(self, item):
+        return self.heap[self.position[item]][0]
+
+    def push(self, item, priority):
+        '''
+        Add item, or lower its priority if it is already in the heap.
+        Return False (and change nothing) if it is in with a lower or equal priority.
+        '''
+        index = self.position.get(item)
+        if index is None:
+            self.heap.append([priority, next(self.counter), item])
+            index = self.position[item] = len(self.heap) - 1
+        elif priority < self.heap[index][0]:
+            self.heap[index][0] = priority
+        else:
+            return False
+        self.sift_up(index)
+        return True
+
+    def pop(self):  # Remove and return (item, priority) with the lowest priority
+        last = self.heap.pop()
+        if not self.heap:
+            del self.position[last[2]]
+            return last[2], last[0]
+        (priority, _, item) = self.heap[0]
+        del self.position[item]
+        self.heap[0] = last
+        self.position[last[2]] = 0
+        self.sift_down(0)
+        return item, priority
+
+    def sift_up(self, index):
+        entry = self.heap[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if self.heap[parent][:2] <= entry[:2]:
+                break
+            self.heap[index] = self.heap[parent]
+            self.position[self.heap[index][2]] = index
+            index = parent
+        self.heap[index] = entry
+        self.position[entry[2]] = index
+
+    def sift_down(self, index):
+        entry = self.heap[index]
+        size = len(self.heap)
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and self.heap[child + 1][:2] < self.heap[child][:2]:
+                child += 1
+            if entry[:2] <= self.heap[child][:2]:
+                break
+            self.heap[index] = self.heap[child]
+            self.position[self.heap[index][2]] = index
+            index = child
+        self.heap[index] = entry
+        self.position[entry[2]] = index
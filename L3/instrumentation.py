@@ -0,0 +1,79 @@
+'''
+Instrumentation for the searches. Pass stats=SearchStats(...) to a search to
+count nodes generated, expanded, re-expanded and duplicates pruned, closed
+states reopened, search iterations, the peak fringe size and elapsed time,
+call hooks, or print a sampled trace of the fringe.
+Searches run with stats=None (the default) are silent and skip all of it.
+A search calls START(stats) when it begins and FINISH(stats, result) when
+it returns, so the counters and elapsed time always cover the last search
+run with that SearchStats.
+The lecture folders do not import each other, so this file is kept
+identical in 'L2 Uninformed Search' and 'L3'.
+'''
+import time
+
+
+class SearchStats:
+    def __init__(self, on_expand=None, trace_every=0, trace=print):
+        '''
+        on_expand(node, children, fringe) is called after every expansion.
+        With trace_every=n the fringe is traced every n-th expansion
+        (trace_every=1 gives the old print-per-expansion output).
+        '''
+        self.on_expand = on_expand
+        self.trace_every = trace_every
+        self.trace = trace
+        self.RESET()
+
+    def RESET(self):
+        self.generated = 0
+        self.expanded = 0
+        self.duplicates = 0
+        self.reopened = 0
+        self.reexpanded = 0
+        self.iterations = 0
+        self.peak_fringe = 0
+        self.start_time = None  # Set by START
+        self.elapsed = 0.0
+
+    def EXPANDED(self, node, children, fringe):
+        self.expanded += 1
+        self.generated += len(children)
+        if len(fringe) > self.peak_fringe:
+            self.peak_fringe = len(fringe)
+        if self.on_expand is not None:
+            self.on_expand(node, children, fringe)
+        if self.trace_every and self.expanded % self.trace_every == 0:
+            self.trace("fringe: {}".format(fringe))
+
+    def DUPLICATE(self, state):
+        self.duplicates += 1
+
+    def REOPENED(self, state):  # A closed state was reached by a cheaper path and will be expanded again
+        self.reopened += 1
+
+    def REEXPANDED(self, state):  # A state was expanded again after its subtree was dropped or cut off
+        self.reexpanded += 1
+
+    def ITERATION(self):  # A new iteration of an iterative search (e.g. a new IDA* bound)
+        self.iterations += 1
+
+    def as_dict(self):
+        return {'generated': self.generated, 'expanded': self.expanded, 'duplicates': self.duplicates,
+                'reopened': self.reopened, 'reexpanded': self.reexpanded, 'iterations': self.iterations,
+                'peak_fringe': self.peak_fringe, 'elapsed': self.elapsed}
+
+    def __repr__(self):
+        return 'SearchStats({})'.format(', '.join('{}={}'.format(*item) for item in self.as_dict().items()))
+
+
+def START(stats):  # Reset the counters, if instrumented, and start the clock
+    if stats is not None:
+        stats.RESET()
+        stats.start_time = time.perf_counter()
+
+
+def FINISH(stats, result):  # Record elapsed time, if instrumented, and pass result through
+    if stats is not None and stats.start_time is not None:
+        stats.elapsed = time.perf_counter() - stats.start_time
+    return result
@@ -0,0 +1,143 @@
+'''
+Search problems as objects instead of module globals, and a batch runner that
+answers many start/goal queries against one loaded graph.
+
+A Graph is loaded once from a STATE_SPACE dict; its adjacency, reverse index
+and per-goal reachability sets are built once and shared by every Problem
+made from it. SOLVE_BATCH can spread the queries over a process pool, which
+receives the graph once per worker rather than once per query.
+'''
+from multiprocessing import Pool
+
+from search import GRAPH_ASTAR_SEARCH, UNIFORM_COST_SEARCH
+
+
+class Problem:
+    def __init__(self, initial_state, goal_test, successors, cost=None, heuristic=None):
+        '''
+        successors(state) gives (child, cost) pairs as in L3, or plain child
+        states (as in L2) when cost(state, child) is given.
+        heuristic(state) defaults to 0.
+        '''
+        self.INITIAL_STATE = initial_state
+        self._goal_test = goal_test
+        self._successors = successors
+        self._cost = cost
+        self._heuristic = heuristic or (lambda state: 0)
+
+    def GOAL_TEST(self, state):
+        return self._goal_test(state)
+
+    def SUCCESSORS(self, state):  # Always (child, cost) pairs
+        if self._cost is None:
+            return self._successors(state)
+        return [(child, self._cost(state, child)) for child in self._successors(state)]
+
+    def HEURISTIC(self, state):
+        return self._heuristic(state)
+
+
+class Graph:
+    def __init__(self, state_space, heuristics=None, weighted=True):
+        '''
+        state_space maps states to (child, cost) pairs, or to plain children
+        with weighted=False (every step then costs 1).
+        '''
+        self.ADJACENCY = {state: [tuple(entry) if weighted else (entry, 1) for entry in children]
+                          for state, children in state_space.items()}
+        self.HEURISTICS = heuristics or {}
+        self._reverse = None
+        self._can_reach = {}  # frozenset of goals -> states with a path to one of them
+
+    def SUCCESSORS(self, state):
+        return self.ADJACENCY.get(state, [])
+
+    def HEURISTIC(self, state):
+        return self.HEURISTICS.get(state, 0)
+
+    def REVERSE_INDEX(self):  # State -> [(parent, cost)], built on first use
+        if self._reverse is None:
+            self._reverse = {}
+            for state, children in self.ADJACENCY.items():
+                for (child, cost) in children:
+                    self._reverse.setdefault(child, []).append((state, cost))
+        return self._reverse
+
+    def CAN_REACH(self, goals):  # States that can reach one of goals, cached per goal set
+        goals = frozenset(goals)
+        if goals not in self._can_reach:
+            reverse = self.REVERSE_INDEX()
+            reached = set(goals)
+            stack = list(goals)
+            while stack:
+                for (parent, _) in reverse.get(stack.pop(), []):
+                    if parent not in reached:
+                        reached.add(parent)
+                        stack.append(parent)
+            self._can_reach[goals] = reached
+        return self._can_reach[goals]
+
+    def PROBLEM(self, initial_state, goals):
+        goals = frozenset(goals)
+        return Problem(initial_state, goals.__contains__, self.SUCCESSORS, heuristic=self.HEURISTIC)
+
+
+SEARCHES = {  # Graph searches only, a STATE_SPACE may have cycles
+    'ucs': lambda problem: UNIFORM_COST_SEARCH(problem.INITIAL_STATE, problem.GOAL_TEST, problem.SUCCESSORS),
+    'astar': lambda problem: GRAPH_ASTAR_SEARCH(1.0, True, problem.INITIAL_STATE, problem.GOAL_TEST,
+                                                problem.SUCCESSORS, problem.HEURISTIC),
+    'greedy': lambda problem: GRAPH_ASTAR_SEARCH(1.0, False, problem.INITIAL_STATE, problem.GOAL_TEST,
+                                                 problem.SUCCESSORS, problem.HEURISTIC, reopen=False),
+}
+
+
+def SOLVE(graph, initial_state, goals, algorithm='ucs'):
+    '''
+    Answer one query. Return (list of states from initial_state to a goal,
+    path cost), or None when no goal can be reached.
+    '''
+    if initial_state not in graph.CAN_REACH(goals):  # Unreachable, no search needed
+        return None
+    path = SEARCHES[algorithm](graph.PROBLEM(initial_state, goals))
+    if path is None:
+        return None
+    return [node.STATE for node in path], path[-1].COST
+
+
+_worker_graph = None  # Graph of a SOLVE_BATCH pool worker
+
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _solve_in_worker(query, algorithm):
+    (initial_state, goals) = query
+    return SOLVE(_worker_graph, initial_state, goals, algorithm)
+
+
+def SOLVE_BATCH(graph, queries, algorithm='ucs', processes=None):
+    '''
+    Solve (initial_state, goals) queries against one graph, in order.
+    With processes set they run concurrently in a process pool.
+    '''
+    if not processes:
+        return [SOLVE(graph, initial_state, goals, algorithm) for (initial_state, goals) in queries]
+    with Pool(processes, initializer=_init_worker, initargs=(graph,)) as pool:
+        return pool.starmap(_solve_in_worker, [(query, algorithm) for query in queries],
+                            chunksize=max(1, len(queries) // (4 * processes)))
+
+
+def run():
+    from search import HEURISTIC_VALUES, STATE_SPACE
+    graph = Graph(STATE_SPACE, HEURISTIC_VALUES)
+    queries = [(start, {'K', 'L'}) for start in STATE_SPACE] + [('A', {'G'}), ('J', {'A'})]
+    for processes in [None, 2]:
+        print('processes: {}'.format(processes or 1))
+        for (query, answer) in zip(queries, SOLVE_BATCH(graph, queries, 'ucs', processes)):
+            print('  {} -> {}: {}'.format(query[0], sorted(query[1]), answer))
+
+
+if __name__ == '__main__':
+    run()
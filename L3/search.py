@@ -1,7 +1,12 @@
 import heapq
 import itertools
 
+from indexed_heap import IndexedHeap
+from instrumentation import FINISH, START, SearchStats
+
 class Node:
+    __slots__ = ('STATE', 'PARENT_NODE', 'DEPTH', 'COST', 'HEURISTIC', 'TOTAL_COST')  # No per-node __dict__
+
     def __init__(self, state, parent=None, depth=0, cost=0, heuristic=0):
         self.STATE = state
         self.PARENT_NODE = parent
@@ -61,31 +66,331 @@ def path_cost(from_node, to_state):
 def successor_fn(state):
     return STATE_SPACE[state]  # now returns list of (child, cost)
 
-def PRIORITY_TREE_SEARCH(weight=1.0, use_astar=True):
+def PRIORITY_TREE_SEARCH(weight=1.0, use_astar=True, initial_state=None, goal_test=None,
+                         successors=None, heuristic_fn=None, stats=None):
+    START(stats)
+    if initial_state is None:
+        initial_state = INITIAL_STATE
+    goal_test = goal_test or (lambda state: state in GOAL_STATES)
+    successors = successors or successor_fn
+    heuristic_fn = heuristic_fn or heuristic
     fringe = []
     counter = itertools.count()
-    h = heuristic(INITIAL_STATE)
-    initial_node = Node(INITIAL_STATE, cost=0, heuristic=h)
+    h = heuristic_fn(initial_state)
+    initial_node = Node(initial_state, cost=0, heuristic=h)
     priority = initial_node.COST + weight * h if use_astar else h
     heapq.heappush(fringe, (priority, next(counter), initial_node))
 
     while fringe:
         _, _, node = heapq.heappop(fringe)
-        if node.STATE in GOAL_STATES:
-            return node.path()
+        if goal_test(node.STATE):
+            return FINISH(stats, node.path())
 
-        for (child_state, edge_cost) in successor_fn(node.STATE):
+        children = []
+        for (child_state, edge_cost) in successors(node.STATE):
             new_cost = node.COST + edge_cost
-            h = heuristic(child_state)
+            h = heuristic_fn(child_state)
             total = new_cost + weight * h if use_astar else h
             child_node = Node(child_state, node, node.DEPTH + 1, new_cost, h)
             heapq.heappush(fringe, (total, next(counter), child_node))
+            children.append(child_node)
+        if stats is not None:
+            stats.EXPANDED(node, children, fringe)
+
+    return FINISH(stats, None)
+
+'''
+Graph-search A*: keeps the cheapest known path cost (g) of every reached
+state and a closed set of expanded states. A child is only pushed when it
+improves on the best g of its state; stale heap entries are skipped when
+popped. A closed state is reopened (expanded again) when a cheaper path to
+it turns up, which only happens when the heuristic is inconsistent.
+reopen=None reopens only once an edge with h(state) > cost + h(child) has
+been seen; True always reopens, False never does (faster, but the path
+may then be more expensive than optimal).
+use_astar=False orders the fringe by h alone (greedy best-first search
+with a closed set).
+'''
+def GRAPH_ASTAR_SEARCH(weight=1.0, use_astar=True, initial_state=None, goal_test=None, successors=None,
+                       heuristic_fn=None, reopen=None, stats=None):
+    START(stats)
+    if initial_state is None:
+        initial_state = INITIAL_STATE
+    goal_test = goal_test or (lambda state: state in GOAL_STATES)
+    successors = successors or successor_fn
+    heuristic_fn = heuristic_fn or heuristic
+    fringe = []
+    counter = itertools.count()
+    h = heuristic_fn(initial_state)
+    heapq.heappush(fringe, (weight * h if use_astar else h, next(counter), Node(initial_state, cost=0, heuristic=h)))
+    best_g = {initial_state: 0}
+    closed = set()
+    inconsistent = False
+
+    while fringe:
+        _, _, node = heapq.heappop(fringe)
+        if node.COST > best_g[node.STATE] or node.STATE in closed:  # Stale entry, a cheaper path was pushed later
+            continue
+        if goal_test(node.STATE):
+            return FINISH(stats, node.path())
+        closed.add(node.STATE)
+
+        children = []
+        for (child_state, edge_cost) in successors(node.STATE):
+            new_cost = node.COST + edge_cost
+            h = heuristic_fn(child_state)
+            if not inconsistent and node.HEURISTIC > edge_cost + h:
+                inconsistent = True
+            if new_cost >= best_g.get(child_state, float('inf')):  # Dominated by a known path
+                if stats is not None:
+                    stats.DUPLICATE(child_state)
+                continue
+            if child_state in closed:
+                if not (reopen or (reopen is None and inconsistent)):
+                    continue
+                closed.discard(child_state)
+                if stats is not None:
+                    stats.REOPENED(child_state)
+            best_g[child_state] = new_cost
+            child_node = Node(child_state, node, node.DEPTH + 1, new_cost, h)
+            total = new_cost + weight * h if use_astar else h
+            heapq.heappush(fringe, (total, next(counter), child_node))
+            children.append(child_node)
+        if stats is not None:
+            stats.EXPANDED(node, children, fringe)
+
+    return FINISH(stats, None)
+
+'''
+Uniform-cost search: expands states in order of path cost using an indexed
+heap with decrease-key, so the fringe holds at most one entry per state.
+Defaults to INITIAL_STATE, GOAL_STATES and successor_fn.
+'''
+def UNIFORM_COST_SEARCH(initial_state=None, goal_test=None, successors=None, stats=None):
+    START(stats)
+    if initial_state is None:
+        initial_state = INITIAL_STATE
+    goal_test = goal_test or (lambda state: state in GOAL_STATES)
+    successors = successors or successor_fn
+    fringe = IndexedHeap()
+    fringe.push(initial_state, 0)
+    best = {initial_state: Node(initial_state)}  # Cheapest known node for each state in the fringe
+    explored = set()
+
+    while fringe:
+        (state, _) = fringe.pop()
+        node = best.pop(state)
+        if goal_test(state):
+            return FINISH(stats, node.path())
+        explored.add(state)
+        children = []
+        for (child_state, edge_cost) in successors(state):
+            if child_state in explored:
+                continue
+            new_cost = node.COST + edge_cost
+            if fringe.push(child_state, new_cost):  # New state or cheaper path (decrease-key)
+                best[child_state] = Node(child_state, node, node.DEPTH + 1, new_cost)
+                children.append(best[child_state])
+            elif stats is not None:
+                stats.DUPLICATE(child_state)
+        if stats is not None:
+            stats.EXPANDED(node, children, fringe)
+
+    return FINISH(stats, None)
 
-    return None
+'''
+IDA*: depth-first searches with an increasing f-cost bound, starting at
+h(initial_state); each iteration raises the bound to the smallest f that
+exceeded it. Memory is only the current path. States already on the path
+are skipped. Expansions of nodes within the previous bound are counted as
+re-expansions (stats.reexpanded), one iteration per bound (stats.iterations).
+'''
+def IDA_STAR_SEARCH(initial_state=None, goal_test=None, successors=None, heuristic_fn=None, stats=None):
+    START(stats)
+    if initial_state is None:
+        initial_state = INITIAL_STATE
+    goal_test = goal_test or (lambda state: state in GOAL_STATES)
+    successors = successors or successor_fn
+    heuristic_fn = heuristic_fn or heuristic
+    root = Node(initial_state, cost=0, heuristic=heuristic_fn(initial_state))
+    if goal_test(initial_state):
+        return FINISH(stats, root.path())
+    bound = root.TOTAL_COST
+    previous_bound = float('-inf')
 
-def run_search(strategy_name, weight=1.0, use_astar=True):
+    while bound < float('inf'):
+        if stats is not None:
+            stats.ITERATION()
+        next_bound = float('inf')  # Smallest f above bound seen in this iteration
+        on_path = {initial_state}
+        children = list(successors(initial_state))
+        stack = [(root, iter(children))]  # The current path, with the successors still to try
+        if stats is not None:
+            stats.EXPANDED(root, children, stack)
+            if root.TOTAL_COST <= previous_bound:
+                stats.REEXPANDED(initial_state)
+        while stack:
+            (node, remaining) = stack[-1]
+            successor = next(remaining, None)
+            if successor is None:  # All successors tried, backtrack
+                stack.pop()
+                on_path.discard(node.STATE)
+                continue
+            (child_state, edge_cost) = successor
+            if child_state in on_path:
+                continue
+            child = Node(child_state, node, node.DEPTH + 1, node.COST + edge_cost, heuristic_fn(child_state))
+            if child.TOTAL_COST > bound:
+                next_bound = min(next_bound, child.TOTAL_COST)
+                continue
+            if goal_test(child_state):
+                return FINISH(stats, child.path())
+            children = list(successors(child_state))
+            on_path.add(child_state)
+            stack.append((child, iter(children)))
+            if stats is not None:
+                stats.EXPANDED(child, children, stack)
+                if child.TOTAL_COST <= previous_bound:
+                    stats.REEXPANDED(child_state)
+        (previous_bound, bound) = (bound, next_bound)
+
+    return FINISH(stats, None)
+
+class SMANode(Node):  # Search-tree node kept in SMA* memory
+    __slots__ = ('OWN_F', 'F', 'CHILDREN', 'MOVES', 'FORGOTTEN', 'VERSION')
+
+    def __init__(self, state, parent=None, depth=0, cost=0, heuristic=0):
+        super().__init__(state, parent, depth, cost, heuristic)
+        self.OWN_F = self.TOTAL_COST  # f of this node itself (after pathmax)
+        self.F = self.TOTAL_COST  # Backed-up f: the best f known below this node
+        self.CHILDREN = []  # Children in memory
+        self.MOVES = None  # (child state, edge cost) not generated yet, None before the first expansion
+        self.FORGOTTEN = {}  # State of a child dropped from memory -> (its f when dropped, edge cost)
+        self.VERSION = 0  # Bumped on every change, older heap entries are stale
+
+    def KEY(self):  # Fringe priority: f of the next successor to generate, inf if there is none
+        if self.MOVES is None or self.MOVES:
+            return self.OWN_F
+        return min((f for (f, _) in self.FORGOTTEN.values()), default=float('inf'))
+
+'''
+Simplified memory-bounded A* (SMA*): best-first like A*, but never more than
+max_nodes search-tree nodes in memory. Each step generates one successor of
+the deepest node with the lowest f; when memory is full the leaf with the
+highest f (shallowest on ties) is dropped first and its parent remembers its
+f. A forgotten child is regenerated, with that f, once it is the lowest on
+the fringe (counted in stats.reexpanded). Optimal when the cheapest solution
+path fits in max_nodes; None when no solution fits.
+'''
+def SMA_STAR_SEARCH(max_nodes=100, initial_state=None, goal_test=None, successors=None,
+                    heuristic_fn=None, stats=None):
+    START(stats)
+    if max_nodes < 2:
+        raise ValueError('max_nodes must be at least 2')
+    if initial_state is None:
+        initial_state = INITIAL_STATE
+    goal_test = goal_test or (lambda state: state in GOAL_STATES)
+    successors = successors or successor_fn
+    heuristic_fn = heuristic_fn or heuristic
+    root = SMANode(initial_state, heuristic=heuristic_fn(initial_state))
+    memory = {root}  # Nodes in memory
+    fringe = []  # (key, -depth, tie-breaker, version, node): deepest lowest key first
+    leaves = []  # (-f, depth, tie-breaker, version, node): shallowest highest f first
+    counter = itertools.count()
+
+    def UPDATE(node):  # Re-file node in the fringe and leaves heaps after a change
+        node.VERSION += 1
+        key = node.KEY()
+        if key < float('inf'):
+            heapq.heappush(fringe, (key, -node.DEPTH, next(counter), node.VERSION, node))
+        if not node.CHILDREN and node is not root:
+            heapq.heappush(leaves, (-node.F, node.DEPTH, next(counter), node.VERSION, node))
+
+    def BACKUP(node):  # Propagate a changed best f towards the root
+        while node is not None:
+            f = min([child.F for child in node.CHILDREN] + [f for (f, _) in node.FORGOTTEN.values()] +
+                    [node.OWN_F if node.MOVES is None or node.MOVES else float('inf')])
+            if f == node.F:
+                return
+            node.F = f
+            UPDATE(node)
+            node = node.PARENT_NODE
+
+    def FORGET(keep):  # Drop the worst leaf other than keep from memory
+        skipped = []
+        while True:
+            entry = heapq.heappop(leaves)
+            leaf = entry[4]
+            if entry[3] != leaf.VERSION or leaf not in memory or leaf.CHILDREN:
+                continue
+            if leaf is not keep:
+                break
+            skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(leaves, entry)
+        memory.discard(leaf)
+        leaf.VERSION += 1  # Invalidates its fringe entry too
+        parent = leaf.PARENT_NODE
+        parent.CHILDREN.remove(leaf)
+        if leaf.F < float('inf'):  # Dead ends are never regenerated
+            parent.FORGOTTEN[leaf.STATE] = (leaf.F, leaf.COST - parent.COST)
+        UPDATE(parent)
+        BACKUP(parent)
+
+    def MOVES(node):  # Cheapest edge to every successor that is not on the path to node
+        ancestors = set()
+        ancestor = node
+        while ancestor is not None:
+            ancestors.add(ancestor.STATE)
+            ancestor = ancestor.PARENT_NODE
+        moves = {}
+        for (child_state, edge_cost) in successors(node.STATE):
+            if child_state not in ancestors and edge_cost < moves.get(child_state, float('inf')):
+                moves[child_state] = edge_cost
+        return list(moves.items())[::-1]  # Generated from the end, in successor order
+
+    UPDATE(root)
+    while fringe:
+        (_, _, _, version, node) = heapq.heappop(fringe)
+        if version != node.VERSION or node not in memory:
+            continue
+        if node.MOVES is None:
+            if goal_test(node.STATE):
+                return FINISH(stats, node.path())
+            node.MOVES = MOVES(node)
+            if not node.MOVES:  # Dead end
+                UPDATE(node)
+                BACKUP(node)
+                continue
+
+        if node.MOVES:  # Next successor
+            (child_state, edge_cost) = node.MOVES.pop()
+            f = node.OWN_F
+        else:  # Regenerate the best forgotten child
+            child_state = min(node.FORGOTTEN, key=lambda state: node.FORGOTTEN[state][0])
+            (f, edge_cost) = node.FORGOTTEN.pop(child_state)
+            if stats is not None:
+                stats.REEXPANDED(node.STATE)
+        child = SMANode(child_state, node, node.DEPTH + 1, node.COST + edge_cost, heuristic_fn(child_state))
+        child.OWN_F = child.F = max(child.TOTAL_COST, f)  # Pathmax, and keep what was learned before it was forgotten
+        if child.DEPTH >= max_nodes - 1 and not goal_test(child_state):
+            child.OWN_F = child.F = float('inf')  # Its subtree cannot fit in memory
+
+        if len(memory) == max_nodes:  # Make room first; node cannot be the only leaf, its depth is below max_nodes - 1
+            FORGET(node)
+        node.CHILDREN.append(child)
+        memory.add(child)
+        UPDATE(child)
+        UPDATE(node)
+        BACKUP(node)
+        if stats is not None:
+            stats.EXPANDED(node, [child], memory)
+
+    return FINISH(stats, None)
+
+def run_search(strategy_name, weight=1.0, use_astar=True, search=None):
     print(f"\n=== {strategy_name} ===")
-    path = PRIORITY_TREE_SEARCH(weight=weight, use_astar=use_astar)
+    path = search() if search else PRIORITY_TREE_SEARCH(weight=weight, use_astar=use_astar)
     if path:
         for node in path:
             node.display()
@@ -93,10 +398,51 @@ def run_search(strategy_name, weight=1.0, use_astar=True):
     else:
         print("No path found.")
 
+def grid_successors(size):  # 4-connected size x size grid with unit costs, full of transpositions
+    def successors(state):
+        (x, y) = state
+        return [((x + dx, y + dy), 1) for (dx, dy) in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                if 0 <= x + dx < size and 0 <= y + dy < size]
+    return successors
+
+def compare_expansions(size=8):
+    goal = (size - 1, size - 1)
+    arguments = dict(initial_state=(0, 0), goal_test=lambda state: state == goal,
+                     successors=grid_successors(size),
+                     heuristic_fn=lambda state: goal[0] - state[0] + goal[1] - state[1])
+    print(f"\n=== Expansions on a {size}x{size} grid ===")
+    for (name, search) in [("A* tree search", lambda stats: PRIORITY_TREE_SEARCH(stats=stats, **arguments)),
+                           ("A* graph search", lambda stats: GRAPH_ASTAR_SEARCH(stats=stats, **arguments)),
+                           ("Uniform-cost", lambda stats: UNIFORM_COST_SEARCH(arguments['initial_state'], arguments['goal_test'],
+                                                                          arguments['successors'], stats))]:
+        stats = SearchStats()
+        path = search(stats)
+        print(f"{name:16s} cost {path[-1].COST:3d}  expanded {stats.expanded:8d}  generated {stats.generated:8d}")
+
+def compare_memory(size=6, max_nodes=30):  # Half the Manhattan distance, so f-bounds grow slowly
+    goal = (size - 1, size - 1)
+    arguments = dict(initial_state=(0, 0), goal_test=lambda state: state == goal,
+                     successors=grid_successors(size),
+                     heuristic_fn=lambda state: (goal[0] - state[0] + goal[1] - state[1]) / 2)
+    print(f"\n=== Memory-bounded searches on a {size}x{size} grid ===")
+    for (name, search) in [("A* graph search", lambda stats: GRAPH_ASTAR_SEARCH(stats=stats, **arguments)),
+                           ("IDA*", lambda stats: IDA_STAR_SEARCH(stats=stats, **arguments)),
+                           (f"SMA* ({max_nodes} nodes)", lambda stats: SMA_STAR_SEARCH(max_nodes, stats=stats, **arguments))]:
+        stats = SearchStats()
+        path = search(stats)
+        print(f"{name:16s} cost {path[-1].COST:3d}  expanded {stats.expanded:8d}  re-expanded {stats.reexpanded:8d}"
+              f"  iterations {stats.iterations:3d}  peak fringe {stats.peak_fringe:5d}")
+
 def run():
     run_search("Greedy Best-First Search", use_astar=False)
     run_search("A* Search", weight=1.0, use_astar=True)
     run_search("Weighted A* Search (w=2)", weight=2.0, use_astar=True)
+    run_search("Uniform-Cost Search", search=UNIFORM_COST_SEARCH)
+    run_search("Graph A* Search", search=GRAPH_ASTAR_SEARCH)
+    run_search("IDA* Search", search=IDA_STAR_SEARCH)
+    run_search("SMA* Search (5 nodes)", search=lambda: SMA_STAR_SEARCH(5))
+    compare_expansions()
+    compare_memory()
 
 if __name__ == '__main__':
     run()
\ No newline at end of file
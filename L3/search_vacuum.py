@@ -1,4 +1,10 @@
+from instrumentation import FINISH, START, SearchStats
+from vacuum_world import VacuumWorld
+
+
 class Node:  # Node has only PARENT_NODE, STATE, DEPTH
+    __slots__ = ('STATE', 'PARENT_NODE', 'DEPTH')  # No per-node __dict__
+
     def __init__(self, state, parent=None, depth=0):
         self.STATE = state
         self.PARENT_NODE = parent
@@ -22,17 +28,20 @@ class Node:  # Node has only PARENT_NODE, STATE, DEPTH
 '''
 Search the tree for the goal state and return path from initial state to goal state
 '''
-def TREE_SEARCH():
+def TREE_SEARCH(stats=None):  # stats=SearchStats() counts or traces the search
+    START(stats)
     fringe = []
     initial_node = Node(INITIAL_STATE)
     fringe = INSERT(initial_node, fringe)
-    while fringe is not None:
+    while fringe:
         node = REMOVE_FIRST(fringe)
         if node.STATE == GOAL_STATE:
-            return node.path()
+            return FINISH(stats, node.path())
         children = EXPAND(node)
         fringe = INSERT_ALL(children, fringe)
-        print("fringe: {}".format(fringe))
+        if stats is not None:
+            stats.EXPANDED(node, children, fringe)
+    return FINISH(stats, None)
 
 
 '''
@@ -43,10 +52,7 @@ def EXPAND(node):
     successors = []
     children = successor_fn(node.STATE)
     for child in children:
-        s = Node(node)  # create node for each in state list
-        s.STATE = child  # e.g. result = 'F' then 'G' from list ['F', 'G']
-        s.PARENT_NODE = node
-        s.DEPTH = node.DEPTH + 1
+        s = Node(child, node, node.DEPTH + 1)  # create node for each in state list
         successors = INSERT(s, successors)
     return successors
 
@@ -79,27 +85,22 @@ def REMOVE_FIRST(queue):
 '''
 Successor function, mapping the nodes to its successors
 '''
-def successor_fn(state):  # Lookup list of successor states
-    return STATE_SPACE[state]  # successor_fn( 'C' ) returns ['F', 'G']
+def successor_fn(state):  # Successors computed on demand instead of looked up in a table
+    return (WORLD.DECODE(child) for child in WORLD.SUCCESSORS(WORLD.ENCODE(state)))
 
 
 INITIAL_STATE = ('B', 'Dirty', 'Dirty')
 GOAL_STATE = ('A', 'Clean', 'Clean')
-STATE_SPACE = {('A', 'Dirty', 'Dirty'): [('A', 'Clean', 'Dirty'), ('A', 'Dirty', 'Dirty'), ('B', 'Dirty', 'Dirty')],
-               ('B', 'Dirty', 'Dirty'): [('B', 'Dirty', 'Clean'), ('B', 'Dirty', 'Dirty'), ('A', 'Dirty', 'Dirty')],
-               ('B', 'Dirty', 'Clean'): [('A', 'Dirty', 'Clean'), ('B', 'Dirty', 'Clean'), ('B', 'Dirty', 'Clean')],
-               ('A', 'Dirty', 'Clean'): [('B', 'Dirty', 'Clean'), ('A', 'Clean', 'Clean'), ('A', 'Dirty', 'Clean')],
-               ('A', 'Clean', 'Dirty'): [('B', 'Clean', 'Dirty'), ('A', 'Clean', 'Dirty'), ('A', 'Clean', 'Dirty')],
-               ('A', 'Clean', 'Clean'): [('B', 'Clean', 'Clean'), ('A', 'Clean', 'Clean'), ('A', 'Clean', 'Clean')],
-               ('B', 'Clean', 'Dirty'): [('A', 'Clean', 'Dirty'), ('B', 'Clean', 'Dirty'), ('B', 'Clean', 'Clean')],
-               ('B', 'Clean', 'Clean'): [('A', 'Clean', 'Clean'), ('B', 'Clean', 'Clean'), ('B', 'Clean', 'Clean')]}
+WORLD = VacuumWorld(2)  # WORLD.STATE_SPACE() shows the full table
 
 
 '''
 Run tree search and display the nodes in the path to goal node
 '''
 def run():
-    path = TREE_SEARCH()
+    stats = SearchStats()
+    path = TREE_SEARCH(stats=stats)
+    print(stats)
     print('Solution path:')
     for node in path:
         node.display()